@@ -192,12 +192,9 @@ export function LiveTerminalView({ name, visible = true, spawnInfo: spawnInfoPro
     // Wire binary data: terminal → pty (non-SGR mouse events)
     // Some mouse protocols encode button/coordinate bytes > 0x7F which xterm.js
     // emits through onBinary instead of onData.
+    // Each char is one byte; latin1 decoding keeps the low 8 bits natively.
     term.onBinary((data: string) => {
-      const bytes = new Uint8Array(data.length)
-      for (let i = 0; i < data.length; i++) {
-        bytes[i] = data.charCodeAt(i) & 0xff
-      }
-      ptyProcess.write(Buffer.from(bytes))
+      ptyProcess.write(Buffer.from(data, 'latin1'))
     })
 
     // Handle exit
@@ -206,6 +203,9 @@ export function LiveTerminalView({ name, visible = true, spawnInfo: spawnInfoPro
       if (exitCode === 0) {
         setState('exited')
       } else {
+        // The cached spawn info may be stale (e.g. the thopter was recreated
+        // from the CLI); resolve it afresh on the next connect.
+        if (!spawnInfoProp) getService().forgetSSHSpawn(name)
         setErrorMsg(`Process exited with code ${exitCode}`)
         setState('error')
       }
@@ -56,6 +56,13 @@ export function createWrappedLinkProvider(
         joined += text
       }
 
+      // Most windows contain no URL at all; a substring scan is far cheaper
+      // than running the regex engine over ~11 rows on every hover.
+      if (!joined.includes('http')) {
+        callback(undefined)
+        return
+      }
+
       // Find all URL matches in the joined text
       const links: ILink[] = []
       URL_RE.lastIndex = 0
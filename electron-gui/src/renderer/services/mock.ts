@@ -303,6 +303,8 @@ export class MockThopterService implements ThopterService {
     return { command: '/bin/bash', args: ['-l'] };
   }
 
+  forgetSSHSpawn(_name: string): void {}
+
   async tellThopter(name: string, message: string, _interrupt?: boolean): Promise<void> {
     await delay(500);
     const info = this.thopters.get(name);
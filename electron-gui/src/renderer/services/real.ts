@@ -160,6 +160,17 @@ async function execThopter(...args: string[]): Promise<string> {
 
 export class RealThopterService implements ThopterService {
   private providerCache: InfrastructureProvider | null = null;
+  /** Thopter name -> devbox/droplet ID, from the latest listThopters. */
+  private thopterIds = new Map<string, string>();
+  /**
+   * SSH spawn info by devbox/droplet ID. Resolving it runs a full `thopter ssh
+   * --spawn-json` (CLI startup plus provider lookups), which otherwise sits in
+   * front of every terminal connect. Keyed by ID rather than name so a thopter
+   * recreated under the same name (new droplet, new IP) misses the cache.
+   * Dropped when the thopter is destroyed, suspended or resumed, when
+   * resolution fails, or via forgetSSHSpawn.
+   */
+  private sshSpawnCache = new Map<string, Promise<{ command: string; args: string[] }>>();
 
   async getProvider(): Promise<InfrastructureProvider> {
     if (this.providerCache) return this.providerCache;
@@ -189,6 +200,7 @@ export class RealThopterService implements ThopterService {
       alive: boolean; claudeRunning: boolean; lastMessage: string | null;
     }>;
 
+    this.thopterIds = new Map(raw.filter((t) => t.id).map((t) => [t.name, t.id]));
     return raw.map((t) => ({
       name: t.name,
       owner: t.owner,
@@ -437,10 +449,28 @@ export class RealThopterService implements ThopterService {
   }
 
   /**
-   * Get SSH spawn command + args by thopter name (resolves devbox ID via Redis).
+   * Get SSH spawn command + args by thopter name, cached per devbox ID.
    */
-  async getSSHSpawn(name: string): Promise<{ command: string; args: string[] }> {
-    const output = await execThopter('ssh', name, '--spawn-json');
+  getSSHSpawn(name: string): Promise<{ command: string; args: string[] }> {
+    const id = this.thopterIds.get(name);
+    // Not in the last listing (e.g. just created): resolve by name, uncached.
+    if (!id) return this.fetchSSHSpawn(name);
+    let spawn = this.sshSpawnCache.get(id);
+    if (!spawn) {
+      spawn = this.fetchSSHSpawn(id);
+      spawn.catch(() => this.sshSpawnCache.delete(id));
+      this.sshSpawnCache.set(id, spawn);
+    }
+    return spawn;
+  }
+
+  forgetSSHSpawn(name: string): void {
+    const id = this.thopterIds.get(name);
+    if (id) this.sshSpawnCache.delete(id);
+  }
+
+  private async fetchSSHSpawn(nameOrId: string): Promise<{ command: string; args: string[] }> {
+    const output = await execThopter('ssh', nameOrId, '--spawn-json');
     return JSON.parse(output) as { command: string; args: string[] };
   }
 
@@ -465,6 +495,8 @@ export class RealThopterService implements ThopterService {
    * Destroy (shut down) a devbox via CLI.
    */
   async destroyThopter(name: string): Promise<void> {
+    this.forgetSSHSpawn(name);
+    this.thopterIds.delete(name);
     await execThopter('destroy', name);
   }
 
@@ -472,6 +504,7 @@ export class RealThopterService implements ThopterService {
    * Suspend a devbox via CLI.
    */
   async suspendThopter(name: string): Promise<void> {
+    this.forgetSSHSpawn(name);
     await execThopter('suspend', name);
   }
 
@@ -479,6 +512,7 @@ export class RealThopterService implements ThopterService {
    * Resume a suspended devbox via CLI.
    */
   async resumeThopter(name: string): Promise<void> {
+    this.forgetSSHSpawn(name);
     await execThopter('resume', name);
   }
 
@@ -126,6 +126,8 @@ export interface ThopterService {
   // SSH
   getSSHSpawn(name: string): Promise<{ command: string; args: string[] }>;
   getSSHSpawnById(devboxId: string): Promise<{ command: string; args: string[] }>;
+  /** Drop any cached spawn info for a thopter (e.g. after a failed connect). */
+  forgetSSHSpawn(name: string): void;
 
   // Mutations
   runThopter(opts: RunThopterOpts): Promise<{ name: string }>;
@@ -31,28 +31,31 @@ if (!/^[A-Za-z0-9_./-]+$/.test(name)) process.exit(0);
 
 const redisKey = `thopter:${name}:transcript`;
 const redisCounterKey = `thopter:${name}:transcript_seq`;
+// Followers (thopter tail -f) subscribe here to wake up without polling.
+const redisEventsChannel = `thopter:${name}:transcript_events`;
 
-// All data is passed via stdin (-x) to avoid shell injection.
-// Only key names (validated above) appear in command args.
-function rcli(...args) {
-  try {
-    execSync(
-      `redis-cli --tls -u "${redisUrl}" ${args.join(" ")}`,
-      { stdio: ["pipe", "pipe", "pipe"], timeout: 5000 },
-    );
-  } catch {
-    // Ignore Redis errors — don't break Claude's workflow
+// Encode commands in the Redis wire protocol (RESP) and send them all through
+// one `redis-cli --pipe` process. One process spawn and one TLS handshake per
+// hook invocation, regardless of how many entries are pushed. All data goes
+// over stdin, so nothing user-controlled ever reaches a shell.
+function encodeCommand(args) {
+  let out = `*${args.length}\r\n`;
+  for (const arg of args) {
+    const s = String(arg);
+    out += `$${Buffer.byteLength(s, "utf-8")}\r\n${s}\r\n`;
   }
+  return out;
 }
 
-function rcliPipe(input, ...args) {
+function redisPipeline(commands) {
+  if (commands.length === 0) return;
   try {
     execSync(
-      `redis-cli --tls -u "${redisUrl}" -x ${args.join(" ")}`,
-      { input, stdio: ["pipe", "pipe", "pipe"], timeout: 5000 },
+      `redis-cli --tls -u "${redisUrl}" --pipe`,
+      { input: commands.map(encodeCommand).join(""), stdio: ["pipe", "pipe", "pipe"], timeout: 5000 },
     );
   } catch {
-    // Ignore Redis errors
+    // Ignore Redis errors — don't break Claude's workflow
   }
 }
 
@@ -187,11 +190,14 @@ function main() {
       role: "system",
       summary: "--- new session ---",
     });
-    rcliPipe(marker, "RPUSH", redisKey);
-    rcli("LTRIM", redisKey, `-${MAX_ENTRIES}`, "-1");
-    rcli("EXPIRE", redisKey, String(TTL_SECONDS));
-    rcli("INCR", redisCounterKey);
-    rcli("EXPIRE", redisCounterKey, String(TTL_SECONDS));
+    redisPipeline([
+      ["RPUSH", redisKey, marker],
+      ["LTRIM", redisKey, `-${MAX_ENTRIES}`, "-1"],
+      ["EXPIRE", redisKey, String(TTL_SECONDS)],
+      ["INCR", redisCounterKey],
+      ["EXPIRE", redisCounterKey, String(TTL_SECONDS)],
+      ["PUBLISH", redisEventsChannel, "1"],
+    ]);
     return;
   }
 
@@ -225,29 +231,29 @@ function main() {
   // Parse new lines — only advance cursor past successfully parsed lines.
   // If the last line is incomplete (mid-write), we leave the cursor before it
   // so the next invocation re-reads and parses the complete line.
-  const text = buf.toString("utf-8");
-  const rawLines = text.split("\n");
-
+  // Split on raw 0x0a bytes (never part of a multi-byte UTF-8 sequence) so
+  // byte offsets fall out of the scan directly and each line is decoded once.
   const newEntries = [];
   let bytesConsumed = 0;
+  let start = 0;
 
-  for (let i = 0; i < rawLines.length; i++) {
-    const rawLine = rawLines[i];
-    // The last element from split("\n") has no trailing newline.
-    // All others do (+1 for the \n delimiter).
-    const isLast = i === rawLines.length - 1;
-    const lineBytes = Buffer.byteLength(rawLine, "utf-8") + (isLast ? 0 : 1);
-    const trimmed = rawLine.trim();
+  while (start < buf.length) {
+    const nl = buf.indexOf(0x0a, start);
+    const end = nl === -1 ? buf.length : nl;
+    // Offset just past this line's \n (or the end of the buffer for the last line)
+    const next = nl === -1 ? buf.length : nl + 1;
+    const trimmed = buf.toString("utf-8", start, end).trim();
+    start = next;
     if (!trimmed) {
       // Empty line — safe to advance past
-      bytesConsumed += lineBytes;
+      bytesConsumed = next;
       continue;
     }
     try {
       const entry = JSON.parse(trimmed);
       const transformed = transformEntry(entry);
       newEntries.push(...transformed);
-      bytesConsumed += lineBytes;
+      bytesConsumed = next;
     } catch {
       // Unparseable — likely a partial line from mid-write.
       // Stop here; don't advance cursor past this line.
@@ -265,15 +271,15 @@ function main() {
 
   // Push to Redis
   if (newEntries.length > 0) {
-    for (const entry of newEntries) {
-      rcliPipe(JSON.stringify(entry), "RPUSH", redisKey);
-    }
-    rcli("LTRIM", redisKey, `-${MAX_ENTRIES}`, "-1");
-    rcli("EXPIRE", redisKey, String(TTL_SECONDS));
-    // Increment sequence counter so follow mode can detect new entries
-    // even when list length is constant (at the 500-entry cap)
-    rcli("INCRBY", redisCounterKey, String(newEntries.length));
-    rcli("EXPIRE", redisCounterKey, String(TTL_SECONDS));
+    const commands = [
+      ["RPUSH", redisKey, ...newEntries.map((entry) => JSON.stringify(entry))],
+      ["LTRIM", redisKey, `-${MAX_ENTRIES}`, "-1"],
+      ["EXPIRE", redisKey, String(TTL_SECONDS)],
+      // Increment sequence counter so follow mode can detect new entries
+      // even when list length is constant (at the 500-entry cap)
+      ["INCRBY", redisCounterKey, String(newEntries.length)],
+      ["EXPIRE", redisCounterKey, String(TTL_SECONDS)],
+    ];
 
     // Update last_message from the most recent transcript entry (any role).
     // This is the tail of the tail — always reflects the latest activity.
@@ -281,7 +287,11 @@ function main() {
     if (lastEntry) {
       let text = lastEntry.full ?? lastEntry.summary;
       if (text.length > 500) text = text.slice(0, 497) + "...";
-      rcliPipe(text, "SETEX", `thopter:${name}:last_message`, String(TTL_SECONDS));
+      commands.push(["SETEX", `thopter:${name}:last_message`, String(TTL_SECONDS), text]);
     }
+
+    // Publish last, once the list and counter are up to date.
+    commands.push(["PUBLISH", redisEventsChannel, String(newEntries.length)]);
+    redisPipeline(commands);
   }
 }
@@ -4,21 +4,70 @@
  * CLI entrypoint for thopter.
  */
 
-import { Command } from "commander";
+import type { Command } from "commander";
 import { loadConfigIntoEnv, resolveThopterName } from "./config.js";
 import { getActiveProvider } from "./provider.js";
 
 // Load API keys from ~/.thopter.json into process.env (won't override existing env vars)
 loadConfigIntoEnv();
 
-const program = new Command();
+// Constructed lazily: the static help fast path never loads commander.
+let program: Command;
 
-program
-  .name("thopter")
-  .description("Manage remote thopters for Claude Code development (DigitalOcean-first, RunLoop-compatible).")
-  .addHelpText(
-    "after",
-    `
+const PROGRAM_DESCRIPTION =
+  "Manage remote thopters for Claude Code development (DigitalOcean-first, RunLoop-compatible).";
+
+/**
+ * Top-level command aliases, resolved on argv before commander sees it.
+ * Listed in the help epilog since commander no longer knows about them.
+ */
+const COMMAND_ALIASES: Record<string, string> = {
+  list: "status",
+  ls: "status",
+  rm: "destroy",
+  kill: "destroy",
+  shutdown: "destroy",
+};
+
+/**
+ * Top-level command table. Each entry registers one command (and its
+ * subcommands) on `program`. Only the invoked command is registered, so a
+ * `thopter status` run doesn't build the option/argument definitions for
+ * every other command; help and unknown commands fall back to the full set.
+ *
+ * `usage` and `description` are also what the static top-level help lists,
+ * so `usage` must match the term commander derives from the command's
+ * arguments and options (e.g. "create [options] [name]").
+ */
+interface CommandSpec {
+  names: string[];
+  usage: string;
+  description: string;
+}
+
+const COMMANDS: (CommandSpec & { register: () => void })[] = [];
+
+function defineCommand(spec: CommandSpec, register: (spec: CommandSpec) => void): void {
+  COMMANDS.push({ ...spec, register: () => register(spec) });
+}
+
+/** Find the command entry named by the first CLI token, if any. */
+function sniffCommand(argv: string[]): (typeof COMMANDS)[number] | undefined {
+  const first = argv[0];
+  if (!first || first.startsWith("-")) return undefined;
+  return COMMANDS.find((cmd) => cmd.names.includes(first));
+}
+
+/** The epilog's alias lines, one per target command, from COMMAND_ALIASES. */
+function aliasHelp(): string {
+  const byTarget = new Map<string, string[]>();
+  for (const [alias, target] of Object.entries(COMMAND_ALIASES)) {
+    byTarget.set(target, [...(byTarget.get(target) ?? []), alias]);
+  }
+  return [...byTarget].map(([target, aliases]) => `  ${aliases.join(", ").padEnd(39)}${target}`).join("\n");
+}
+
+const HELP_EPILOG = `
 lifecycle:
   setup → create → ssh/exec → snapshot create → destroy
                                      ↓
@@ -38,6 +87,7 @@ examples:
   thopter snapshot default golden         Set default snapshot
   thopter snapshot default               View default snapshot
   thopter snapshot default --clear        Clear default snapshot
+  thopter pool fill -n 2                 Pre-boot 2 droplets for faster creates
   thopter use dev                        Set default thopter
   thopter use                            View current default
   thopter use --clear                    Clear default thopter
@@ -57,580 +107,853 @@ examples:
   thopter keepalive dev                  Reset keep-alive timer (RunLoop mode)
   thopter suspend dev                    Suspend a thopter (RunLoop mode)
   thopter resume dev                     Resume a suspended thopter (RunLoop mode)
-  thopter destroy dev                    Shut down a thopter`,
-  );
-
-program
-  .command("provider")
-  .description("Show active infrastructure provider")
-  .option("--json", "Output as JSON")
-  .action((opts: { json?: boolean }) => {
-    const provider = getActiveProvider();
-    if (opts.json) {
-      process.stdout.write(JSON.stringify({ provider }) + "\n");
-      return;
-    }
-    console.log(provider);
-  });
+  thopter destroy dev                    Shut down a thopter
+  thopter destroy dev worker-1 worker-2  Shut down several thopters at once
+
+aliases:
+${aliasHelp()}`;
+
+/**
+ * Top-level help for `thopter`, `thopter -h` and `thopter --help`, printed
+ * without loading commander or registering any commands. Built from the
+ * command table in commander's layout, so it can't drift from the
+ * descriptions the commands are registered with.
+ */
+function topLevelHelp(): string {
+  const rows: [string, string][] = [
+    ...COMMANDS.map((cmd): [string, string] => [cmd.usage, cmd.description]),
+    ["help [command]", "display help for command"],
+  ];
+  const options: [string, string][] = [["-h, --help", "display help for command"]];
+  const width = Math.max(...[...rows, ...options].map(([term]) => term.length)) + 2;
+  const format = ([term, desc]: [string, string]) => `  ${term.padEnd(width)}${desc}`;
+  return `Usage: thopter [options] [command]
+
+${PROGRAM_DESCRIPTION}
+
+Options:
+${options.map(format).join("\n")}
+
+Commands:
+${rows.map(format).join("\n")}
+${HELP_EPILOG}
+`;
+}
+
+// --- provider ---
+defineCommand({
+  names: ["provider"],
+  usage: "provider [options]",
+  description: "Show active infrastructure provider",
+}, ({ description }) => {
+  program
+    .command("provider")
+    .description(description)
+    .option("--json", "Output as JSON")
+    .action((opts: { json?: boolean }) => {
+      const provider = getActiveProvider();
+      if (opts.json) {
+        process.stdout.write(JSON.stringify({ provider }) + "\n");
+        return;
+      }
+      console.log(provider);
+    });
+});
 
 // --- setup ---
-program
-  .command("setup")
-  .description("Interactive first-time setup for the active provider plus env vars and notifications")
-  .action(async () => {
-    const { runSetup } = await import("./setup.js");
-    await runSetup();
-  });
+defineCommand({
+  names: ["setup"],
+  usage: "setup",
+  description: "Interactive first-time setup for the active provider plus env vars and notifications",
+}, ({ description }) => {
+  program
+    .command("setup")
+    .description(description)
+    .action(async () => {
+      const { runSetup } = await import("./setup.js");
+      await runSetup();
+    });
+});
 
 // --- create ---
-program
-  .command("create")
-  .description("Create a new thopter")
-  .argument("[name]", "Name for the thopter (auto-generated if omitted)")
-  .option("--snapshot <id>", "Snapshot ID or label to restore from")
-  .option("--fresh", "Create a fresh devbox, ignoring the default snapshot")
-  .option("--keep-alive <minutes>", "Keep-alive time in minutes before shutdown (default: 1440)", parseInt)
-  .option("-a, --attach", "SSH into the devbox after creation")
-  .action(async (name: string | undefined, opts: { snapshot?: string; fresh?: boolean; keepAlive?: number; attach?: boolean }) => {
-    const { createDevbox, sshDevbox } = await import("./devbox.js");
-    const { generateName } = await import("./names.js");
-    const resolvedName = name ?? generateName();
-    await createDevbox({
-      name: resolvedName,
-      snapshotId: opts.snapshot,
-      fresh: opts.fresh,
-      keepAlive: opts.keepAlive ? opts.keepAlive * 60 : undefined,
-    });
-    if (opts.attach) {
-      await sshDevbox(resolvedName);
-    }
-  });
+defineCommand({
+  names: ["create"],
+  usage: "create [options] [name]",
+  description: "Create a new thopter",
+}, ({ description }) => {
+  program
+    .command("create")
+    .description(description)
+    .argument("[name]", "Name for the thopter (auto-generated if omitted)")
+    .option("--snapshot <id>", "Snapshot ID or label to restore from")
+    .option("--fresh", "Create a fresh devbox, ignoring the default snapshot")
+    .option("--keep-alive <minutes>", "Keep-alive time in minutes before shutdown (default: 1440)", parseInt)
+    .option("-a, --attach", "SSH into the devbox after creation")
+    .option("-q, --quiet", "Don't stream cloud-init logs while waiting for boot")
+    .action(async (name: string | undefined, opts: { snapshot?: string; fresh?: boolean; keepAlive?: number; attach?: boolean; quiet?: boolean }) => {
+      const { createDevbox, sshDevbox } = await import("./devbox.js");
+      const { generateName } = await import("./names.js");
+      const resolvedName = name ?? generateName();
+      await createDevbox({
+        name: resolvedName,
+        snapshotId: opts.snapshot,
+        fresh: opts.fresh,
+        keepAlive: opts.keepAlive ? opts.keepAlive * 60 : undefined,
+        quiet: opts.quiet,
+      });
+      if (opts.attach) {
+        await sshDevbox(resolvedName);
+      }
+    });
+});
 
 // --- status (unified: Runloop API + Redis annotations) ---
-program
-  .command("status")
-  .alias("list")
-  .alias("ls")
-  .description("Show thopter status (provider + Redis view)")
-  .argument("[name]", "Thopter name (omit for overview of all)")
-  .option("-f, --follow [interval]", "Re-render every N seconds (default: 10)")
-  .option("-w, --wide", "Force wide (single-line) layout")
-  .option("-n, --narrow", "Force narrow (multi-line) layout")
-  .option("--json", "Output as JSON (for programmatic use)")
-  .action(async (name: string | undefined, opts: { follow?: boolean | string; wide?: boolean; narrow?: boolean; json?: boolean }) => {
-    const follow = opts.follow === true ? 10 : opts.follow ? Number(opts.follow) : undefined;
-    const layout = opts.wide ? "wide" as const : opts.narrow ? "narrow" as const : undefined;
-    if (name) {
-      const { showThopterStatus } = await import("./status.js");
-      await showThopterStatus(resolveThopterName(name));
-    } else {
-      const { listDevboxes } = await import("./devbox.js");
-      await listDevboxes({ follow, layout, json: opts.json });
-    }
-  });
+defineCommand({
+  names: ["status"],
+  usage: "status [options] [name]",
+  description: "Show thopter status (provider + Redis view)",
+}, ({ description }) => {
+  program
+    .command("status")
+    .description(description)
+    .argument("[name]", "Thopter name (omit for overview of all)")
+    .option("-f, --follow [interval]", "Re-render every N seconds (default: 10)")
+    .option("-w, --wide", "Force wide (single-line) layout")
+    .option("-n, --narrow", "Force narrow (multi-line) layout")
+    .option("--json", "Output as JSON (for programmatic use)")
+    .action(async (name: string | undefined, opts: { follow?: boolean | string; wide?: boolean; narrow?: boolean; json?: boolean }) => {
+      const follow = opts.follow === true ? 10 : opts.follow ? Number(opts.follow) : undefined;
+      const layout = opts.wide ? "wide" as const : opts.narrow ? "narrow" as const : undefined;
+      if (name) {
+        const { showThopterStatus } = await import("./status.js");
+        await showThopterStatus(resolveThopterName(name));
+      } else {
+        const { listDevboxes } = await import("./devbox.js");
+        await listDevboxes({ follow, layout, json: opts.json });
+      }
+    });
+});
 
 // --- tail ---
-program
-  .command("tail")
-  .description("Tail a thopter's Claude transcript from Redis")
-  .argument("<name>", "Thopter name")
-  .option("-f, --follow", "Continuously poll for new entries")
-  .option("-n, --lines <count>", "Number of entries to show (default: 20)", parseInt)
-  .option("-s, --short", "Truncated single-line output (default: full messages)")
-  .action(async (name: string, opts: { follow?: boolean; lines?: number; short?: boolean }) => {
-    const { tailTranscript } = await import("./tail.js");
-    await tailTranscript(resolveThopterName(name), { follow: opts.follow, lines: opts.lines, short: opts.short });
-  });
+defineCommand({
+  names: ["tail"],
+  usage: "tail [options] <name>",
+  description: "Tail a thopter's Claude transcript from Redis",
+}, ({ description }) => {
+  program
+    .command("tail")
+    .description(description)
+    .argument("<name>", "Thopter name")
+    .option("-f, --follow", "Continuously poll for new entries")
+    .option("-n, --lines <count>", "Number of entries to show (default: 20)", parseInt)
+    .option("-s, --short", "Truncated single-line output (default: full messages)")
+    .action(async (name: string, opts: { follow?: boolean; lines?: number; short?: boolean }) => {
+      const { tailTranscript } = await import("./tail.js");
+      await tailTranscript(resolveThopterName(name), { follow: opts.follow, lines: opts.lines, short: opts.short });
+    });
+});
 
 // --- check ---
-program
-  .command("check")
-  .description("Check if a thopter has tmux and Claude running")
-  .argument("<name>", "Thopter name")
-  .option("--json", "Output as JSON")
-  .action(async (name: string, opts: { json?: boolean }) => {
-    const { checkClaude } = await import("./tell.js");
-    const result = await checkClaude(resolveThopterName(name));
-    if (opts.json) {
-      process.stdout.write(JSON.stringify(result) + "\n");
-    } else {
-      console.log(`tmux:   ${result.tmux ? "running" : "not running"}`);
-      console.log(`claude: ${result.claude ? "running" : "not running"}`);
-      if (!result.tmux) {
-        console.log("\nNo tmux session. Claude needs to be launched.");
-        console.log(`  SSH in and start Claude: thopter ssh ${name}`);
-      } else if (!result.claude) {
-        console.log("\ntmux is running but Claude is not in any pane.");
-        console.log(`  SSH in and start Claude: thopter ssh ${name}`);
+defineCommand({
+  names: ["check"],
+  usage: "check [options] <name>",
+  description: "Check if a thopter has tmux and Claude running",
+}, ({ description }) => {
+  program
+    .command("check")
+    .description(description)
+    .argument("<name>", "Thopter name")
+    .option("--json", "Output as JSON")
+    .action(async (name: string, opts: { json?: boolean }) => {
+      const { checkClaude } = await import("./tell.js");
+      const result = await checkClaude(resolveThopterName(name));
+      if (opts.json) {
+        process.stdout.write(JSON.stringify(result) + "\n");
+      } else {
+        console.log(`tmux:   ${result.tmux ? "running" : "not running"}`);
+        console.log(`claude: ${result.claude ? "running" : "not running"}`);
+        if (!result.tmux) {
+          console.log("\nNo tmux session. Claude needs to be launched.");
+          console.log(`  SSH in and start Claude: thopter ssh ${name}`);
+        } else if (!result.claude) {
+          console.log("\ntmux is running but Claude is not in any pane.");
+          console.log(`  SSH in and start Claude: thopter ssh ${name}`);
+        }
       }
-    }
-  });
+    });
+});
 
 // --- tell ---
-program
-  .command("tell")
-  .description("Send a message to a running Claude session")
-  .argument("<name>", "Thopter name")
-  .argument("<message>", "Message to send to Claude")
-  .option("-i, --interrupt", "Interrupt Claude first (send Escape), then deliver the message")
-  .option("--no-tail", "Exit after sending (don't follow transcript)")
-  .action(async (name: string, message: string, opts: { interrupt?: boolean; tail?: boolean }) => {
-    const { tellThopter } = await import("./tell.js");
-    await tellThopter(resolveThopterName(name), message, { interrupt: opts.interrupt, noTail: opts.tail === false });
-  });
+defineCommand({
+  names: ["tell"],
+  usage: "tell [options] <name> <message>",
+  description: "Send a message to a running Claude session",
+}, ({ description }) => {
+  program
+    .command("tell")
+    .description(description)
+    .argument("<name>", "Thopter name")
+    .argument("<message>", "Message to send to Claude")
+    .option("-i, --interrupt", "Interrupt Claude first (send Escape), then deliver the message")
+    .option("--no-tail", "Exit after sending (don't follow transcript)")
+    .action(async (name: string, message: string, opts: { interrupt?: boolean; tail?: boolean }) => {
+      const { tellThopter } = await import("./tell.js");
+      await tellThopter(resolveThopterName(name), message, { interrupt: opts.interrupt, noTail: opts.tail === false });
+    });
+});
 
 // --- run ---
-function collect(value: string, previous: string[]): string[] {
-  return previous.concat([value]);
-}
-
-program
-  .command("run")
-  .description("Create a thopter and run Claude with a prompt")
-  .argument("<prompt>", "The prompt to give Claude")
-  .option("--repo <owner/repo>", "GitHub repository to clone")
-  .option("--branch <name>", "Git branch to start from")
-  .option("--home", "Use ~/workspace as working directory (no single repo)")
-  .option("--checkout <repo[:branch]>", "Pre-checkout a repo into ~/workspace (repeatable, use with --home)", collect, [])
-  .option("--name <name>", "Thopter name (auto-generated if omitted)")
-  .option("--snapshot <id>", "Snapshot to use")
-  .option("--keep-alive <minutes>", "Keep-alive time in minutes", parseInt)
-  .action(async (prompt: string, opts: { repo?: string; branch?: string; home?: boolean; checkout?: string[]; name?: string; snapshot?: string; keepAlive?: number }) => {
-    const { runThopter } = await import("./run.js");
-    await runThopter({ prompt, homeDir: opts.home, checkout: opts.checkout, ...opts });
-  });
+defineCommand({
+  names: ["run"],
+  usage: "run [options] <prompt>",
+  description: "Create a thopter and run Claude with a prompt",
+}, ({ description }) => {
+  function collect(value: string, previous: string[]): string[] {
+    return previous.concat([value]);
+  }
+
+  program
+    .command("run")
+    .description(description)
+    .argument("<prompt>", "The prompt to give Claude")
+    .option("--repo <owner/repo>", "GitHub repository to clone")
+    .option("--branch <name>", "Git branch to start from")
+    .option("--home", "Use ~/workspace as working directory (no single repo)")
+    .option("--checkout <repo[:branch]>", "Pre-checkout a repo into ~/workspace (repeatable, use with --home)", collect, [])
+    .option("--name <name>", "Thopter name (auto-generated if omitted)")
+    .option("--snapshot <id>", "Snapshot to use")
+    .option("--keep-alive <minutes>", "Keep-alive time in minutes", parseInt)
+    .action(async (prompt: string, opts: { repo?: string; branch?: string; home?: boolean; checkout?: string[]; name?: string; snapshot?: string; keepAlive?: number }) => {
+      const { runThopter } = await import("./run.js");
+      await runThopter({ prompt, homeDir: opts.home, checkout: opts.checkout, ...opts });
+    });
+});
 
 // --- reauth ---
-program
-  .command("reauth")
-  .description("Interactive wizard to re-authenticate Claude Code and update the default snapshot")
-  .action(async () => {
-    const { runReauth } = await import("./reauth.js");
-    await runReauth();
-  });
+defineCommand({
+  names: ["reauth"],
+  usage: "reauth",
+  description: "Interactive wizard to re-authenticate Claude Code and update the default snapshot",
+}, ({ description }) => {
+  program
+    .command("reauth")
+    .description(description)
+    .action(async () => {
+      const { runReauth } = await import("./reauth.js");
+      await runReauth();
+    });
+});
 
 // --- use ---
-program
-  .command("use")
-  .description("Set or view the default thopter (use '.' in commands to reference it)")
-  .argument("[name]", "Thopter name to set as default (omit to view current)")
-  .option("--clear", "Clear the default thopter")
-  .action(async (name: string | undefined, opts: { clear?: boolean }) => {
-    const {
-      getDefaultThopter,
-      setDefaultThopter,
-      clearDefaultThopter,
-    } = await import("./config.js");
-
-    if (opts.clear) {
-      clearDefaultThopter();
-      console.log("Default thopter cleared.");
-    } else if (name) {
-      setDefaultThopter(name);
-      console.log(`Default thopter set to: ${name}`);
-      console.log("Use '.' as the name in any command to reference it.");
-    } else {
-      const current = getDefaultThopter();
-      if (current) {
-        console.log(`Default thopter: ${current}`);
+defineCommand({
+  names: ["use"],
+  usage: "use [options] [name]",
+  description: "Set or view the default thopter (use '.' in commands to reference it)",
+}, ({ description }) => {
+  program
+    .command("use")
+    .description(description)
+    .argument("[name]", "Thopter name to set as default (omit to view current)")
+    .option("--clear", "Clear the default thopter")
+    .action(async (name: string | undefined, opts: { clear?: boolean }) => {
+      const {
+        getDefaultThopter,
+        setDefaultThopter,
+        clearDefaultThopter,
+      } = await import("./config.js");
+
+      if (opts.clear) {
+        clearDefaultThopter();
+        console.log("Default thopter cleared.");
+      } else if (name) {
+        setDefaultThopter(name);
+        console.log(`Default thopter set to: ${name}`);
+        console.log("Use '.' as the name in any command to reference it.");
       } else {
-        console.log("No default thopter set.");
-        console.log("  Set one with: thopter use <name>");
+        const current = getDefaultThopter();
+        if (current) {
+          console.log(`Default thopter: ${current}`);
+        } else {
+          console.log("No default thopter set.");
+          console.log("  Set one with: thopter use <name>");
+        }
       }
-    }
-  });
+    });
+});
 
 // --- repos ---
-const reposCmd = program
-  .command("repos")
-  .description("Manage predefined repositories for `thopter run`");
-
-reposCmd
-  .command("list")
-  .alias("ls")
-  .description("List predefined repos")
-  .action(async () => {
-    const { listRepos } = await import("./repos.js");
-    listRepos();
-  });
-
-reposCmd
-  .command("add")
-  .description("Add a predefined repo (interactive)")
-  .action(async () => {
-    const { addRepoInteractive } = await import("./repos.js");
-    await addRepoInteractive();
-  });
-
-reposCmd
-  .command("remove")
-  .alias("rm")
-  .description("Remove a predefined repo (interactive)")
-  .action(async () => {
-    const { removeRepoInteractive } = await import("./repos.js");
-    await removeRepoInteractive();
-  });
-
-reposCmd
-  .command("edit")
-  .description("Edit a predefined repo (interactive)")
-  .action(async () => {
-    const { editRepoInteractive } = await import("./repos.js");
-    await editRepoInteractive();
-  });
+defineCommand({
+  names: ["repos"],
+  usage: "repos",
+  description: "Manage predefined repositories for `thopter run`",
+}, ({ description }) => {
+  const reposCmd = program
+    .command("repos")
+    .description(description);
+
+  reposCmd
+    .command("list")
+    .alias("ls")
+    .description("List predefined repos")
+    .action(async () => {
+      const { listRepos } = await import("./repos.js");
+      listRepos();
+    });
+
+  reposCmd
+    .command("add")
+    .description("Add a predefined repo (interactive)")
+    .action(async () => {
+      const { addRepoInteractive } = await import("./repos.js");
+      await addRepoInteractive();
+    });
+
+  reposCmd
+    .command("remove")
+    .alias("rm")
+    .description("Remove a predefined repo (interactive)")
+    .action(async () => {
+      const { removeRepoInteractive } = await import("./repos.js");
+      await removeRepoInteractive();
+    });
+
+  reposCmd
+    .command("edit")
+    .description("Edit a predefined repo (interactive)")
+    .action(async () => {
+      const { editRepoInteractive } = await import("./repos.js");
+      await editRepoInteractive();
+    });
+});
 
 // --- destroy ---
-program
-  .command("destroy")
-  .alias("rm")
-  .alias("kill")
-  .alias("shutdown")
-  .description("Shut down a thopter")
-  .argument("<devbox>", "Thopter name or ID")
-  .action(async (devbox: string) => {
-    const { destroyDevbox } = await import("./devbox.js");
-    await destroyDevbox(resolveThopterName(devbox));
-  });
+defineCommand({
+  names: ["destroy"],
+  usage: "destroy <devbox...>",
+  description: "Shut down one or more thopters",
+}, ({ description }) => {
+  program
+    .command("destroy")
+    .description(description)
+    .argument("<devbox...>", "Thopter names or IDs")
+    .action(async (devboxes: string[]) => {
+      const { destroyDevboxes } = await import("./devbox.js");
+      await destroyDevboxes(devboxes.map(resolveThopterName));
+    });
+});
 
 // --- suspend ---
-program
-  .command("suspend")
-  .description("Suspend a thopter (RunLoop mode only)")
-  .argument("<devbox>", "Thopter name or ID")
-  .action(async (devbox: string) => {
-    const { suspendDevbox } = await import("./devbox.js");
-    await suspendDevbox(resolveThopterName(devbox));
-  });
+defineCommand({
+  names: ["suspend"],
+  usage: "suspend <devbox>",
+  description: "Suspend a thopter (RunLoop mode only)",
+}, ({ description }) => {
+  program
+    .command("suspend")
+    .description(description)
+    .argument("<devbox>", "Thopter name or ID")
+    .action(async (devbox: string) => {
+      const { suspendDevbox } = await import("./devbox.js");
+      await suspendDevbox(resolveThopterName(devbox));
+    });
+});
 
 // --- resume ---
-program
-  .command("resume")
-  .description("Resume a suspended thopter (RunLoop mode only)")
-  .argument("<devbox>", "Thopter name or ID")
-  .action(async (devbox: string) => {
-    const { resumeDevbox } = await import("./devbox.js");
-    await resumeDevbox(resolveThopterName(devbox));
-  });
+defineCommand({
+  names: ["resume"],
+  usage: "resume <devbox>",
+  description: "Resume a suspended thopter (RunLoop mode only)",
+}, ({ description }) => {
+  program
+    .command("resume")
+    .description(description)
+    .argument("<devbox>", "Thopter name or ID")
+    .action(async (devbox: string) => {
+      const { resumeDevbox } = await import("./devbox.js");
+      await resumeDevbox(resolveThopterName(devbox));
+    });
+});
 
 // --- keepalive ---
-program
-  .command("keepalive")
-  .description("Reset a thopter's keep-alive timer (RunLoop mode only)")
-  .argument("<devbox>", "Thopter name or ID")
-  .action(async (devbox: string) => {
-    const { keepaliveDevbox } = await import("./devbox.js");
-    await keepaliveDevbox(resolveThopterName(devbox));
-  });
+defineCommand({
+  names: ["keepalive"],
+  usage: "keepalive <devbox>",
+  description: "Reset a thopter's keep-alive timer (RunLoop mode only)",
+}, ({ description }) => {
+  program
+    .command("keepalive")
+    .description(description)
+    .argument("<devbox>", "Thopter name or ID")
+    .action(async (devbox: string) => {
+      const { keepaliveDevbox } = await import("./devbox.js");
+      await keepaliveDevbox(resolveThopterName(devbox));
+    });
+});
 
 // --- ssh ---
-program
-  .command("ssh")
-  .description("SSH into a thopter")
-  .argument("<devbox>", "Thopter name or ID")
-  .option("-L, --forward-local <spec>", "Add a local port forward (repeatable)", collectValues, [])
-  .option("-R, --forward-remote <spec>", "Add a remote port forward (repeatable)", collectValues, [])
-  .option("-D, --forward-dynamic <spec>", "Add a dynamic/SOCKS port forward (repeatable)", collectValues, [])
-  .option("-N, --no-command", "Set up port forwarding without opening a shell")
-  .option("--spawn-json", "Print JSON spawn info instead of connecting")
-  .action(async (
-    devbox: string,
-    opts: {
-      forwardLocal?: string[];
-      forwardRemote?: string[];
-      forwardDynamic?: string[];
-      noCommand?: boolean;
-      spawnJson?: boolean;
-    },
-  ) => {
-    const { sshDevbox, getSSHSpawn } = await import("./devbox.js");
-    const sshOptions = {
-      localForwards: opts.forwardLocal ?? [],
-      remoteForwards: opts.forwardRemote ?? [],
-      dynamicForwards: opts.forwardDynamic ?? [],
-      noCommand: opts.noCommand ?? false,
-    };
-    if (opts.spawnJson) {
-      const spawn = await getSSHSpawn(resolveThopterName(devbox), {
-        ...sshOptions,
-        remoteCommand: sshOptions.noCommand ? undefined : "bash -l",
-      });
-      process.stdout.write(JSON.stringify(spawn) + "\n");
-      return;
-    }
-    await sshDevbox(resolveThopterName(devbox), sshOptions);
-  });
+defineCommand({
+  names: ["ssh"],
+  usage: "ssh [options] <devbox>",
+  description: "SSH into a thopter",
+}, ({ description }) => {
+  program
+    .command("ssh")
+    .description(description)
+    .argument("<devbox>", "Thopter name or ID")
+    .option("-L, --forward-local <spec>", "Add a local port forward (repeatable)", collectValues, [])
+    .option("-R, --forward-remote <spec>", "Add a remote port forward (repeatable)", collectValues, [])
+    .option("-D, --forward-dynamic <spec>", "Add a dynamic/SOCKS port forward (repeatable)", collectValues, [])
+    .option("-N, --no-command", "Set up port forwarding without opening a shell")
+    .option("--spawn-json", "Print JSON spawn info instead of connecting")
+    .action(async (
+      devbox: string,
+      opts: {
+        forwardLocal?: string[];
+        forwardRemote?: string[];
+        forwardDynamic?: string[];
+        noCommand?: boolean;
+        spawnJson?: boolean;
+      },
+    ) => {
+      const { sshDevbox, getSSHSpawn } = await import("./devbox.js");
+      const sshOptions = {
+        localForwards: opts.forwardLocal ?? [],
+        remoteForwards: opts.forwardRemote ?? [],
+        dynamicForwards: opts.forwardDynamic ?? [],
+        noCommand: opts.noCommand ?? false,
+      };
+      if (opts.spawnJson) {
+        const spawn = await getSSHSpawn(resolveThopterName(devbox), {
+          ...sshOptions,
+          remoteCommand: sshOptions.noCommand ? undefined : "bash -l",
+        });
+        process.stdout.write(JSON.stringify(spawn) + "\n");
+        return;
+      }
+      await sshDevbox(resolveThopterName(devbox), sshOptions);
+    });
+});
 
 // --- attach ---
-program
-  .command("attach")
-  .description("SSH into a thopter and attach to tmux in control mode (-CC)")
-  .argument("<devbox>", "Thopter name or ID")
-  .action(async (devbox: string) => {
-    const { attachDevbox } = await import("./devbox.js");
-    await attachDevbox(resolveThopterName(devbox));
-  });
+defineCommand({
+  names: ["attach"],
+  usage: "attach <devbox>",
+  description: "SSH into a thopter and attach to tmux in control mode (-CC)",
+}, ({ description }) => {
+  program
+    .command("attach")
+    .description(description)
+    .argument("<devbox>", "Thopter name or ID")
+    .action(async (devbox: string) => {
+      const { attachDevbox } = await import("./devbox.js");
+      await attachDevbox(resolveThopterName(devbox));
+    });
+});
 
 // --- exec ---
-program
-  .command("exec")
-  .description("Run a command in a thopter")
-  .argument("<devbox>", "Thopter name or ID")
-  .argument("<command...>", "Command and arguments")
-  .action(async (devbox: string, command: string[]) => {
-    const { execDevbox } = await import("./devbox.js");
-    await execDevbox(resolveThopterName(devbox), command);
-  });
+defineCommand({
+  names: ["exec"],
+  usage: "exec <devbox> <command...>",
+  description: "Run a command in a thopter",
+}, ({ description }) => {
+  program
+    .command("exec")
+    .description(description)
+    .argument("<devbox>", "Thopter name or ID")
+    .argument("<command...>", "Command and arguments")
+    .action(async (devbox: string, command: string[]) => {
+      const { execDevbox } = await import("./devbox.js");
+      await execDevbox(resolveThopterName(devbox), command);
+    });
+});
 
 // --- snapshot (subcommand) ---
-const snapshotCmd = program
-  .command("snapshot")
-  .description("Manage disk snapshots");
-
-snapshotCmd
-  .command("list")
-  .alias("ls")
-  .description("List disk snapshots")
-  .action(async () => {
-    const { listSnapshotsCmd } = await import("./devbox.js");
-    await listSnapshotsCmd();
-  });
-
-snapshotCmd
-  .command("create")
-  .description("Take a disk snapshot of a thopter")
-  .argument("<devbox>", "Thopter name or ID")
-  .argument("[name]", "Name/label for the snapshot")
-  .action(async (devbox: string, name?: string) => {
-    const { snapshotDevbox } = await import("./devbox.js");
-    await snapshotDevbox(resolveThopterName(devbox), name);
-  });
-
-snapshotCmd
-  .command("replace")
-  .description("Replace an existing snapshot with a fresh one from a thopter")
-  .argument("<devbox>", "Thopter name or ID")
-  .argument("<name>", "Name of the snapshot to replace")
-  .action(async (devbox: string, name: string) => {
-    const { replaceSnapshot } = await import("./devbox.js");
-    await replaceSnapshot(resolveThopterName(devbox), name);
-  });
-
-snapshotCmd
-  .command("destroy")
-  .alias("rm")
-  .description("Delete a snapshot")
-  .argument("<snapshot>", "Snapshot name or ID")
-  .action(async (snapshot: string) => {
-    const { deleteSnapshot } = await import("./devbox.js");
-    await deleteSnapshot(snapshot);
-  });
-
-snapshotCmd
-  .command("default")
-  .description("View or set the default snapshot for new creates")
-  .argument("[snapshot]", "Snapshot name or ID to set as default (omit to view current)")
-  .option("--clear", "Clear the default snapshot")
-  .action(async (snapshot: string | undefined, opts: { clear?: boolean }) => {
-    const {
-      getDefaultSnapshot,
-      setDefaultSnapshot,
-      clearDefaultSnapshot,
-    } = await import("./config.js");
-
-    if (opts.clear) {
-      clearDefaultSnapshot();
-      console.log("Default snapshot cleared.");
-    } else if (snapshot) {
-      setDefaultSnapshot(snapshot);
-      console.log(`Default snapshot set to: ${snapshot}`);
-    } else {
-      const current = getDefaultSnapshot();
-      if (current) {
-        console.log(`Default snapshot: ${current}`);
+defineCommand({
+  names: ["snapshot"],
+  usage: "snapshot",
+  description: "Manage disk snapshots",
+}, ({ description }) => {
+  const snapshotCmd = program
+    .command("snapshot")
+    .description(description);
+
+  snapshotCmd
+    .command("list")
+    .alias("ls")
+    .description("List disk snapshots")
+    .action(async () => {
+      const { listSnapshotsCmd } = await import("./devbox.js");
+      await listSnapshotsCmd();
+    });
+
+  snapshotCmd
+    .command("create")
+    .description("Take a disk snapshot of a thopter")
+    .argument("<devbox>", "Thopter name or ID")
+    .argument("[name]", "Name/label for the snapshot")
+    .action(async (devbox: string, name?: string) => {
+      const { snapshotDevbox } = await import("./devbox.js");
+      await snapshotDevbox(resolveThopterName(devbox), name);
+    });
+
+  snapshotCmd
+    .command("replace")
+    .description("Replace an existing snapshot with a fresh one from a thopter")
+    .argument("<devbox>", "Thopter name or ID")
+    .argument("<name>", "Name of the snapshot to replace")
+    .action(async (devbox: string, name: string) => {
+      const { replaceSnapshot } = await import("./devbox.js");
+      await replaceSnapshot(resolveThopterName(devbox), name);
+    });
+
+  snapshotCmd
+    .command("destroy")
+    .alias("rm")
+    .description("Delete a snapshot")
+    .argument("<snapshot>", "Snapshot name or ID")
+    .action(async (snapshot: string) => {
+      const { deleteSnapshot } = await import("./devbox.js");
+      await deleteSnapshot(snapshot);
+    });
+
+  snapshotCmd
+    .command("default")
+    .description("View or set the default snapshot for new creates")
+    .argument("[snapshot]", "Snapshot name or ID to set as default (omit to view current)")
+    .option("--clear", "Clear the default snapshot")
+    .action(async (snapshot: string | undefined, opts: { clear?: boolean }) => {
+      const {
+        getDefaultSnapshot,
+        setDefaultSnapshot,
+        clearDefaultSnapshot,
+      } = await import("./config.js");
+
+      if (opts.clear) {
+        clearDefaultSnapshot();
+        console.log("Default snapshot cleared.");
+      } else if (snapshot) {
+        setDefaultSnapshot(snapshot);
+        console.log(`Default snapshot set to: ${snapshot}`);
       } else {
-        console.log("No default snapshot set.");
-        console.log("  Set one with: thopter snapshot default <name-or-id>");
+        const current = getDefaultSnapshot();
+        if (current) {
+          console.log(`Default snapshot: ${current}`);
+        } else {
+          console.log("No default snapshot set.");
+          console.log("  Set one with: thopter snapshot default <name-or-id>");
+        }
       }
-    }
-  });
+    });
+});
+
+// --- pool (subcommand) ---
+defineCommand({
+  names: ["pool"],
+  usage: "pool",
+  description: "Manage the warm pool of pre-booted droplets (DigitalOcean mode)",
+}, ({ description }) => {
+  const poolCmd = program
+    .command("pool")
+    .description(description);
+
+  poolCmd
+    .command("fill")
+    .description("Pre-create warm droplets that 'thopter create' will claim")
+    .argument("[snapshot]", "Snapshot ID or label (default: the default snapshot)")
+    .option("-n, --count <n>", "Number of droplets to add (default: 1)", parseInt)
+    .option("--fresh", "Pool fresh droplets, ignoring the default snapshot")
+    .action(async (snapshot: string | undefined, opts: { count?: number; fresh?: boolean }) => {
+      const { fillPool } = await import("./devbox.js");
+      await fillPool({ snapshotId: snapshot, fresh: opts.fresh, count: opts.count });
+    });
+
+  poolCmd
+    .command("list")
+    .alias("ls")
+    .description("List warm pool droplets")
+    .action(async () => {
+      const { listPool } = await import("./devbox.js");
+      await listPool();
+    });
+
+  poolCmd
+    .command("drain")
+    .description("Delete all of your warm pool droplets")
+    .action(async () => {
+      const { drainPool } = await import("./devbox.js");
+      await drainPool();
+    });
+});
 
 // --- config ---
-const configCmd = program
-  .command("config")
-  .description("Manage local configuration (~/.thopter.json)");
-
-configCmd
-  .command("set")
-  .description("Set a config value")
-  .argument("<key>", "Config key")
-  .argument("<value>", "Config value")
-  .action(async (key: string, value: string) => {
-    const { setRunloopApiKey, setDefaultSnapshot, setDefaultRepo, setDefaultBranch, setStopNotifications, setStopNotificationQuietPeriod, setDefaultThopter } = await import("./config.js");
-    switch (key) {
-      case "runloopApiKey":
-        setRunloopApiKey(value);
-        console.log("Set runloopApiKey.");
-        break;
-      case "defaultSnapshotName":
-      case "defaultSnapshotId": // Legacy alias
-        setDefaultSnapshot(value);
-        console.log(`Set defaultSnapshotName to: ${value}`);
-        break;
-      case "defaultRepo":
-        setDefaultRepo(value);
-        console.log(`Set defaultRepo to: ${value}`);
-        break;
-      case "defaultBranch":
-        setDefaultBranch(value);
-        console.log(`Set defaultBranch to: ${value}`);
-        break;
-      case "stopNotifications":
-        setStopNotifications(value === "true" || value === "1");
-        console.log(`Set stopNotifications to: ${value === "true" || value === "1"}`);
-        break;
-      case "stopNotificationQuietPeriod":
-        setStopNotificationQuietPeriod(parseInt(value, 10));
-        console.log(`Set stopNotificationQuietPeriod to: ${parseInt(value, 10)} seconds`);
-        break;
-      case "defaultThopter":
-        setDefaultThopter(value);
-        console.log(`Set defaultThopter to: ${value}`);
-        break;
-      default:
+defineCommand({
+  names: ["config"],
+  usage: "config",
+  description: "Manage local configuration (~/.thopter.json)",
+}, ({ description }) => {
+  const configCmd = program
+    .command("config")
+    .description(description);
+
+  type ConfigModule = typeof import("./config.js");
+
+  // `config set` / `config get` handlers per key. set returns the confirmation
+  // message; get returns the display value.
+  const configKeys: Record<string, {
+    note?: string;
+    legacy?: boolean;
+    set: (cfg: ConfigModule, value: string) => string;
+    get: (cfg: ConfigModule) => string;
+  }> = {
+    runloopApiKey: {
+      note: "(RunLoop mode)",
+      set: (cfg, value) => {
+        cfg.setRunloopApiKey(value);
+        return "Set runloopApiKey.";
+      },
+      get: (cfg) => (cfg.getRunloopApiKey() ? "(set)" : "(not set)"),
+    },
+    defaultSnapshotName: {
+      set: (cfg, value) => {
+        cfg.setDefaultSnapshot(value);
+        return `Set defaultSnapshotName to: ${value}`;
+      },
+      get: (cfg) => cfg.getDefaultSnapshot() ?? "(not set)",
+    },
+    defaultRepo: {
+      set: (cfg, value) => {
+        cfg.setDefaultRepo(value);
+        return `Set defaultRepo to: ${value}`;
+      },
+      get: (cfg) => cfg.getDefaultRepo() ?? "(not set)",
+    },
+    defaultBranch: {
+      set: (cfg, value) => {
+        cfg.setDefaultBranch(value);
+        return `Set defaultBranch to: ${value}`;
+      },
+      get: (cfg) => cfg.getDefaultBranch() ?? "(not set)",
+    },
+    stopNotifications: {
+      set: (cfg, value) => {
+        const enabled = value === "true" || value === "1";
+        cfg.setStopNotifications(enabled);
+        return `Set stopNotifications to: ${enabled}`;
+      },
+      get: (cfg) => String(cfg.getStopNotifications()),
+    },
+    stopNotificationQuietPeriod: {
+      set: (cfg, value) => {
+        const seconds = parseInt(value, 10);
+        cfg.setStopNotificationQuietPeriod(seconds);
+        return `Set stopNotificationQuietPeriod to: ${seconds} seconds`;
+      },
+      get: (cfg) => `${cfg.getStopNotificationQuietPeriod()}s`,
+    },
+    defaultThopter: {
+      set: (cfg, value) => {
+        cfg.setDefaultThopter(value);
+        return `Set defaultThopter to: ${value}`;
+      },
+      get: (cfg) => cfg.getDefaultThopter() ?? "(not set)",
+    },
+  };
+  // Legacy alias: stores a snapshot name, not an ID
+  configKeys.defaultSnapshotId = { ...configKeys.defaultSnapshotName, legacy: true };
+
+  const lookupConfigKey = (key: string) =>
+    Object.hasOwn(configKeys, key) ? configKeys[key] : undefined;
+  const availableConfigKeys = Object.entries(configKeys)
+    .filter(([, entry]) => !entry.legacy)
+    .map(([name, entry]) => (entry.note ? `${name} ${entry.note}` : name))
+    .join(", ");
+
+  configCmd
+    .command("set")
+    .description("Set a config value")
+    .argument("<key>", "Config key")
+    .argument("<value>", "Config value")
+    .action(async (key: string, value: string) => {
+      const entry = lookupConfigKey(key);
+      if (!entry) {
         console.error(`Unknown config key: ${key}`);
-      console.error("Available keys: runloopApiKey (RunLoop mode), defaultSnapshotName, defaultRepo, defaultBranch, stopNotifications, stopNotificationQuietPeriod, defaultThopter");
+        console.error(`Available keys: ${availableConfigKeys}`);
         console.error("For env vars (THOPTER_REDIS_URL, THOPTER_NTFY_CHANNEL, etc.): thopter env set <KEY> <VALUE>");
         process.exit(1);
-    }
-  });
-
-configCmd
-  .command("get")
-  .description("Get a config value")
-  .argument("[key]", "Config key (omit to show all)")
-  .action(async (key?: string) => {
-    const { getRunloopApiKey, getDefaultSnapshot, getDefaultRepo, getDefaultBranch, getStopNotifications, getStopNotificationQuietPeriod, getEnvVars, getDefaultThopter, getRepos } = await import("./config.js");
-    if (!key) {
-      console.log(`runloopApiKey (RunLoop only):   ${getRunloopApiKey() ? "(set)" : "(not set)"}`);
-      console.log(`defaultSnapshotName:             ${getDefaultSnapshot() ?? "(not set)"}`);
-      console.log(`defaultRepo:                    ${getDefaultRepo() ?? "(not set)"}`);
-      console.log(`defaultBranch:                  ${getDefaultBranch() ?? "(not set)"}`);
-      console.log(`stopNotifications:              ${getStopNotifications()}`);
-      console.log(`stopNotificationQuietPeriod:    ${getStopNotificationQuietPeriod()}s`);
-      console.log(`defaultThopter:                 ${getDefaultThopter() ?? "(not set)"}`);
-      const repos = getRepos();
-      console.log(`repos:                          ${repos.length > 0 ? `${repos.length} configured (see: thopter repos list)` : "(none)"}`);
-      const envVars = getEnvVars();
-      const envCount = Object.keys(envVars).length;
-      console.log(`envVars:                        ${envCount > 0 ? `${envCount} configured (see: thopter env list)` : "(none)"}`);
-
-    } else {
-      switch (key) {
-        case "runloopApiKey":
-          console.log(getRunloopApiKey() ? "(set)" : "(not set)");
-          break;
-        case "defaultSnapshotName":
-        case "defaultSnapshotId": // Legacy alias
-          console.log(getDefaultSnapshot() ?? "(not set)");
-          break;
-        case "defaultRepo":
-          console.log(getDefaultRepo() ?? "(not set)");
-          break;
-        case "defaultBranch":
-          console.log(getDefaultBranch() ?? "(not set)");
-          break;
-        case "stopNotifications":
-          console.log(getStopNotifications());
-          break;
-        case "stopNotificationQuietPeriod":
-          console.log(`${getStopNotificationQuietPeriod()}s`);
-          break;
-        case "defaultThopter":
-          console.log(getDefaultThopter() ?? "(not set)");
-          break;
-        default:
+      }
+      console.log(entry.set(await import("./config.js"), value));
+    });
+
+  configCmd
+    .command("get")
+    .description("Get a config value")
+    .argument("[key]", "Config key (omit to show all)")
+    .action(async (key?: string) => {
+      const cfg = await import("./config.js");
+      const { getRunloopApiKey, getDefaultSnapshot, getDefaultRepo, getDefaultBranch, getStopNotifications, getStopNotificationQuietPeriod, getEnvVars, getDefaultThopter, getRepos } = cfg;
+      if (!key) {
+        console.log(`runloopApiKey (RunLoop only):   ${getRunloopApiKey() ? "(set)" : "(not set)"}`);
+        console.log(`defaultSnapshotName:             ${getDefaultSnapshot() ?? "(not set)"}`);
+        console.log(`defaultRepo:                    ${getDefaultRepo() ?? "(not set)"}`);
+        console.log(`defaultBranch:                  ${getDefaultBranch() ?? "(not set)"}`);
+        console.log(`stopNotifications:              ${getStopNotifications()}`);
+        console.log(`stopNotificationQuietPeriod:    ${getStopNotificationQuietPeriod()}s`);
+        console.log(`defaultThopter:                 ${getDefaultThopter() ?? "(not set)"}`);
+        const repos = getRepos();
+        console.log(`repos:                          ${repos.length > 0 ? `${repos.length} configured (see: thopter repos list)` : "(none)"}`);
+        const envVars = getEnvVars();
+        const envCount = Object.keys(envVars).length;
+        console.log(`envVars:                        ${envCount > 0 ? `${envCount} configured (see: thopter env list)` : "(none)"}`);
+
+      } else {
+        const entry = lookupConfigKey(key);
+        if (!entry) {
           console.error(`Unknown config key: ${key}`);
-          console.error("Available keys: runloopApiKey (RunLoop mode), defaultSnapshotName, defaultRepo, defaultBranch, stopNotifications, stopNotificationQuietPeriod, defaultThopter");
+          console.error(`Available keys: ${availableConfigKeys}`);
           console.error("For env vars: thopter env list");
           process.exit(1);
+        }
+        console.log(entry.get(cfg));
       }
-    }
-  });
+    });
+});
 
 // --- env ---
-const envCmd = program
-  .command("env")
-  .description("Manage devbox environment variables (stored in ~/.thopter.json)");
-
-envCmd
-  .command("list")
-  .alias("ls")
-  .description("List configured env vars (values masked)")
-  .action(async () => {
-    const { getEnvVars } = await import("./config.js");
-    const { printTable } = await import("./output.js");
-    const envVars = getEnvVars();
-    const entries = Object.entries(envVars);
-    if (entries.length === 0) {
-      console.log("No env vars configured.");
-      console.log("  Set one with: thopter env set <KEY> <VALUE>");
-      return;
-    }
-    console.log("Devbox environment variables:");
-    printTable(
-      ["NAME", "VALUE"],
-      entries.map(([k, v]) => [k, v.length > 4 ? v.slice(0, 4) + "..." : "***"]),
-    );
-  });
-
-envCmd
-  .command("set")
-  .description("Set a devbox environment variable (prompts for value if omitted)")
-  .argument("<key>", "Variable name (e.g. GH_TOKEN)")
-  .argument("[value]", "Variable value (omit to enter interactively)")
-  .action(async (key: string, value?: string) => {
-    const { setEnvVar } = await import("./config.js");
-
-    if (!value) {
-      // Interactive prompt — keeps sensitive values out of shell history
-      const { createInterface } = await import("node:readline");
-      const rl = createInterface({ input: process.stdin, terminal: true });
-      process.stdout.write(`Value for ${key}: `);
-      value = await new Promise<string>((resolve) => {
-        rl.question("", (answer) => {
-          rl.close();
-          process.stdout.write("\n");
-          resolve(answer.trim());
-        });
-      });
-      if (!value) {
-        console.log("No value provided. Aborting.");
+defineCommand({
+  names: ["env"],
+  usage: "env",
+  description: "Manage devbox environment variables (stored in ~/.thopter.json)",
+}, ({ description }) => {
+  const envCmd = program
+    .command("env")
+    .description(description);
+
+  envCmd
+    .command("list")
+    .alias("ls")
+    .description("List configured env vars (values masked)")
+    .action(async () => {
+      const { getEnvVars } = await import("./config.js");
+      const { printTable } = await import("./output.js");
+      const envVars = getEnvVars();
+      const entries = Object.entries(envVars);
+      if (entries.length === 0) {
+        console.log("No env vars configured.");
+        console.log("  Set one with: thopter env set <KEY> <VALUE>");
         return;
       }
-    }
-
-    setEnvVar(key, value);
-    console.log(`Set ${key}.`);
-  });
-
-envCmd
-  .command("delete")
-  .alias("rm")
-  .description("Remove a devbox environment variable")
-  .argument("<key>", "Variable name")
-  .action(async (key: string) => {
-    const { deleteEnvVar } = await import("./config.js");
-    deleteEnvVar(key);
-    console.log(`Deleted ${key}.`);
-  });
+      console.log("Devbox environment variables:");
+      printTable(
+        ["NAME", "VALUE"],
+        entries.map(([k, v]) => [k, v.length > 4 ? v.slice(0, 4) + "..." : "***"]),
+      );
+    });
+
+  envCmd
+    .command("set")
+    .description("Set a devbox environment variable (prompts for value if omitted)")
+    .argument("<key>", "Variable name (e.g. GH_TOKEN)")
+    .argument("[value]", "Variable value (omit to enter interactively)")
+    .action(async (key: string, value?: string) => {
+      const { setEnvVar } = await import("./config.js");
+
+      if (!value) {
+        // Interactive prompt — keeps sensitive values out of shell history
+        const { createInterface } = await import("node:readline");
+        const rl = createInterface({ input: process.stdin, terminal: true });
+        process.stdout.write(`Value for ${key}: `);
+        value = await new Promise<string>((resolve) => {
+          rl.question("", (answer) => {
+            rl.close();
+            process.stdout.write("\n");
+            resolve(answer.trim());
+          });
+        });
+        if (!value) {
+          console.log("No value provided. Aborting.");
+          return;
+        }
+      }
+
+      setEnvVar(key, value);
+      console.log(`Set ${key}.`);
+    });
+
+  envCmd
+    .command("delete")
+    .alias("rm")
+    .description("Remove a devbox environment variable")
+    .argument("<key>", "Variable name")
+    .action(async (key: string) => {
+      const { deleteEnvVar } = await import("./config.js");
+      deleteEnvVar(key);
+      console.log(`Deleted ${key}.`);
+    });
+});
 
 function collectValues(value: string, previous: string[]): string[] {
   previous.push(value);
   return previous;
 }
 
-// Parse and run
-program.parseAsync(process.argv).catch((err) => {
+/**
+ * Hand-parsed fast paths for the hottest commands. `exec` only splits a
+ * thopter name from the rest of argv and `destroy` only takes names, so
+ * there's nothing for commander to do. Anything unusual (flags, --help, missing args) returns undefined and
+ * takes the normal commander path, so errors and help text are unchanged.
+ */
+function fastPathCommand(argv: string[]): (() => Promise<void>) | undefined {
+  const [cmd, ...rest] = argv;
+  if (cmd === "exec") {
+    const sep = rest.indexOf("--");
+    const before = sep === -1 ? rest : rest.slice(0, sep);
+    if (before.some((a) => a.startsWith("-"))) return undefined;
+    const positional = sep === -1 ? before : [...before, ...rest.slice(sep + 1)];
+    if (positional.length < 2) return undefined;
+    const [devbox, ...command] = positional;
+    return async () => {
+      const { execDevbox } = await import("./devbox.js");
+      await execDevbox(resolveThopterName(devbox), command);
+    };
+  }
+  if (cmd === "destroy") {
+    if (rest.length === 0 || rest.some((a) => a.startsWith("-"))) return undefined;
+    return async () => {
+      const { destroyDevboxes } = await import("./devbox.js");
+      await destroyDevboxes(rest.map(resolveThopterName));
+    };
+  }
+  return undefined;
+}
+
+function exitWithError(err: unknown): never {
   console.error(err instanceof Error ? err.message : String(err));
   process.exit(1);
-});
+}
+
+// Parse and run: resolve aliases, take a fast path if one applies, otherwise
+// register the invoked command (or everything, for help/unknown) and let
+// commander dispatch.
+const args = process.argv.slice(2);
+if (args[0] && Object.hasOwn(COMMAND_ALIASES, args[0])) args[0] = COMMAND_ALIASES[args[0]];
+
+const fastPath = fastPathCommand(args);
+if (args.length === 0) {
+  // Same as commander: help on stderr, non-zero exit
+  process.stderr.write(topLevelHelp());
+  process.exit(1);
+} else if (args.length === 1 && (args[0] === "-h" || args[0] === "--help")) {
+  process.stdout.write(topLevelHelp());
+} else if (fastPath) {
+  fastPath().catch(exitWithError);
+} else {
+  const { Command } = await import("commander");
+  program = new Command()
+    .name("thopter")
+    .description(PROGRAM_DESCRIPTION)
+    .addHelpText("after", HELP_EPILOG);
+
+  const invoked = sniffCommand(args);
+  for (const cmd of invoked ? [invoked] : COMMANDS) cmd.register();
+  program.parseAsync(args, { from: "user" }).catch(exitWithError);
+}
@@ -1,13 +1,17 @@
 /**
  * Runloop SDK client factory.
+ *
+ * The SDK is imported on first use rather than at module load, so
+ * DigitalOcean-mode commands (which never touch Runloop) don't pay for
+ * loading it just because devbox.ts references the client.
  */
 
-import Runloop from "@runloop/api-client";
+import type Runloop from "@runloop/api-client";
 import { isDigitalOceanProvider } from "./provider.js";
 
 let _client: Runloop | undefined;
 
-export function getClient(): Runloop {
+export async function getClient(): Promise<Runloop> {
   if (isDigitalOceanProvider()) {
     throw new Error(
       "Runloop client requested while provider is set to DigitalOcean. This operation is not migrated yet.",
@@ -22,6 +26,7 @@ export function getClient(): Runloop {
     process.exit(1);
   }
 
-  _client = new Runloop({ bearerToken: apiKey });
+  const { default: RunloopClient } = await import("@runloop/api-client");
+  _client = new RunloopClient({ bearerToken: apiKey });
   return _client;
 }
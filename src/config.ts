@@ -3,7 +3,18 @@
  * Local config (~/.thopter.json) stores developer settings.
  */
 
-import { readFileSync, writeFileSync, existsSync } from "node:fs";
+import {
+  readFileSync,
+  renameSync,
+  rmSync,
+  statSync,
+  realpathSync,
+  openSync,
+  writeSync,
+  fchmodSync,
+  fstatSync,
+  closeSync,
+} from "node:fs";
 import { join } from "node:path";
 import { homedir } from "node:os";
 
@@ -46,19 +57,132 @@ interface LocalConfig {
   envVars?: Record<string, string>;
   defaultThopter?: string;
   repos?: RepoConfig[];
+  /** Snapshot name -> ID resolved on a previous run (DigitalOcean). */
+  snapshotIds?: Record<string, { id: string; checkedAt: number }>;
+}
+
+/**
+ * Parsed config, keyed by the file's mtime. A single CLI run reads the config
+ * many times (loadConfigIntoEnv, then every getter); this avoids re-reading and
+ * re-parsing the file unless it changed on disk. Callers get a copy, since the
+ * setters mutate the returned object before saving it.
+ */
+let _configCache: { mtimeMs: number; config: LocalConfig } | undefined;
+
+function configMtime(): number | undefined {
+  try {
+    return statSync(CONFIG_FILE).mtimeMs;
+  } catch {
+    return undefined;
+  }
 }
 
 function loadLocalConfig(): LocalConfig {
-  if (!existsSync(CONFIG_FILE)) return {};
+  const mtimeMs = configMtime();
+  if (mtimeMs === undefined) {
+    _configCache = undefined;
+    return {};
+  }
+  if (_configCache?.mtimeMs === mtimeMs) return structuredClone(_configCache.config);
+  let config: LocalConfig;
   try {
-    return JSON.parse(readFileSync(CONFIG_FILE, "utf-8"));
+    config = JSON.parse(readFileSync(CONFIG_FILE, "utf-8"));
   } catch {
     return {};
   }
+  _configCache = { mtimeMs, config };
+  return structuredClone(config);
 }
 
+/**
+ * Write the config atomically: write a temp file next to it and rename over
+ * the original, so an interrupted write can't leave a truncated config behind.
+ * The config holds API keys and tokens, so the temp file gets the existing
+ * file's permissions (0600 for a new config), and a symlinked config (e.g.
+ * from a dotfiles repo) is written through to its target rather than replaced.
+ */
 function saveLocalConfig(config: LocalConfig): void {
-  writeFileSync(CONFIG_FILE, JSON.stringify(config, null, 2) + "\n");
+  let target = CONFIG_FILE;
+  let mode = 0o600;
+  try {
+    target = realpathSync(CONFIG_FILE);
+    mode = statSync(target).mode & 0o777;
+  } catch {
+    // No config yet: create it private.
+  }
+  const tmpFile = `${target}.${process.pid}.tmp`;
+  let mtimeMs: number;
+  try {
+    const fd = openSync(tmpFile, "w", mode);
+    try {
+      writeSync(fd, JSON.stringify(config, null, 2) + "\n");
+      fchmodSync(fd, mode); // the create mode is subject to umask
+      // Take the cache key from our own file: rename keeps the mtime, and a
+      // stat after the rename could see another writer's file instead.
+      mtimeMs = fstatSync(fd).mtimeMs;
+    } finally {
+      closeSync(fd);
+    }
+    renameSync(tmpFile, target);
+  } catch (err) {
+    rmSync(tmpFile, { force: true });
+    throw err;
+  }
+  _configCache = { mtimeMs, config: structuredClone(config) };
+}
+
+const LOCK_FILE = `${CONFIG_FILE}.lock`;
+const LOCK_TIMEOUT_MS = 5000;
+/** A lock older than this was left by a crashed process. */
+const LOCK_STALE_MS = 10_000;
+
+/** Run fn holding an exclusive lockfile (O_EXCL create) next to the config. */
+function withConfigLock<T>(fn: () => T): T {
+  const deadline = Date.now() + LOCK_TIMEOUT_MS;
+  for (;;) {
+    try {
+      closeSync(openSync(LOCK_FILE, "wx"));
+      break;
+    } catch (err) {
+      if ((err as NodeJS.ErrnoException).code !== "EEXIST") throw err;
+    }
+    try {
+      if (Date.now() - statSync(LOCK_FILE).mtimeMs > LOCK_STALE_MS) {
+        rmSync(LOCK_FILE, { force: true });
+        continue;
+      }
+    } catch {
+      continue; // released between our open and stat
+    }
+    if (Date.now() > deadline) {
+      throw new Error(
+        `Timed out waiting for ${LOCK_FILE}. If no other thopter command is running, delete it and retry.`,
+      );
+    }
+    Atomics.wait(new Int32Array(new SharedArrayBuffer(4)), 0, 0, 25);
+  }
+  try {
+    return fn();
+  } finally {
+    rmSync(LOCK_FILE, { force: true });
+  }
+}
+
+/**
+ * Read-modify-write the config under the config lock, so two thopter commands
+ * saving at the same time can't drop each other's edits. The mutator can
+ * return false to skip the write.
+ */
+function updateLocalConfig(mutate: (config: LocalConfig) => boolean | void): void {
+  withConfigLock(() => {
+    // Re-read from disk rather than trusting the mtime-keyed cache: a write
+    // from another process within the filesystem's timestamp resolution
+    // wouldn't show up as a new mtime.
+    _configCache = undefined;
+    const config = loadLocalConfig();
+    if (mutate(config) === false) return;
+    saveLocalConfig(config);
+  });
 }
 
 export function getDefaultSnapshot(): string | undefined {
@@ -67,17 +191,45 @@ export function getDefaultSnapshot(): string | undefined {
 }
 
 export function setDefaultSnapshot(name: string): void {
-  const config = loadLocalConfig();
-  config.defaultSnapshotName = name;
-  delete config.defaultSnapshotId; // Migrate away from legacy field
-  saveLocalConfig(config);
+  updateLocalConfig((config) => {
+    config.defaultSnapshotName = name;
+    delete config.defaultSnapshotId; // Migrate away from legacy field
+  });
 }
 
 export function clearDefaultSnapshot(): void {
-  const config = loadLocalConfig();
-  delete config.defaultSnapshotName;
-  delete config.defaultSnapshotId;
-  saveLocalConfig(config);
+  updateLocalConfig((config) => {
+    delete config.defaultSnapshotName;
+    delete config.defaultSnapshotId;
+  });
+}
+
+// --- Snapshot name -> ID cache ---
+// Resolving a snapshot name means listing every snapshot on the account, on
+// every create. Remember the answer for a while; callers still confirm the
+// cached ID exists and carries the name (a single point lookup) before
+// trusting it, and re-list once the entry is older than the caller's maxAgeMs
+// so a duplicate name created elsewhere is reported as ambiguous again.
+
+export function getCachedSnapshotId(name: string, maxAgeMs: number): string | undefined {
+  const entry = loadLocalConfig().snapshotIds?.[name];
+  if (!entry || typeof entry !== "object") return undefined;
+  return Date.now() - entry.checkedAt <= maxAgeMs ? entry.id : undefined;
+}
+
+export function cacheSnapshotId(name: string, id: string): void {
+  updateLocalConfig((config) => {
+    config.snapshotIds = { ...config.snapshotIds, [name]: { id, checkedAt: Date.now() } };
+  });
+}
+
+export function forgetSnapshotId(name: string): void {
+  // Cheap unlocked check first, so lookups that had nothing cached skip the lock.
+  if (!loadLocalConfig().snapshotIds?.[name]) return;
+  updateLocalConfig((config) => {
+    if (!config.snapshotIds || !(name in config.snapshotIds)) return false;
+    delete config.snapshotIds[name];
+  });
 }
 
 export function getDefaultRepo(): string | undefined {
@@ -85,9 +237,9 @@ export function getDefaultRepo(): string | undefined {
 }
 
 export function setDefaultRepo(repo: string): void {
-  const config = loadLocalConfig();
-  config.defaultRepo = repo;
-  saveLocalConfig(config);
+  updateLocalConfig((config) => {
+    config.defaultRepo = repo;
+  });
 }
 
 export function getDefaultBranch(): string | undefined {
@@ -95,9 +247,9 @@ export function getDefaultBranch(): string | undefined {
 }
 
 export function setDefaultBranch(branch: string): void {
-  const config = loadLocalConfig();
-  config.defaultBranch = branch;
-  saveLocalConfig(config);
+  updateLocalConfig((config) => {
+    config.defaultBranch = branch;
+  });
 }
 
 export function getStopNotifications(): boolean {
@@ -105,9 +257,9 @@ export function getStopNotifications(): boolean {
 }
 
 export function setStopNotifications(enabled: boolean): void {
-  const config = loadLocalConfig();
-  config.stopNotifications = enabled;
-  saveLocalConfig(config);
+  updateLocalConfig((config) => {
+    config.stopNotifications = enabled;
+  });
 }
 
 export function getStopNotificationQuietPeriod(): number {
@@ -115,9 +267,9 @@ export function getStopNotificationQuietPeriod(): number {
 }
 
 export function setStopNotificationQuietPeriod(seconds: number): void {
-  const config = loadLocalConfig();
-  config.stopNotificationQuietPeriod = seconds;
-  saveLocalConfig(config);
+  updateLocalConfig((config) => {
+    config.stopNotificationQuietPeriod = seconds;
+  });
 }
 
 export function getRunloopApiKey(): string | undefined {
@@ -125,9 +277,9 @@ export function getRunloopApiKey(): string | undefined {
 }
 
 export function setRunloopApiKey(key: string): void {
-  const config = loadLocalConfig();
-  config.runloopApiKey = key;
-  saveLocalConfig(config);
+  updateLocalConfig((config) => {
+    config.runloopApiKey = key;
+  });
 }
 
 export function getDefaultThopter(): string | undefined {
@@ -135,15 +287,15 @@ export function getDefaultThopter(): string | undefined {
 }
 
 export function setDefaultThopter(name: string): void {
-  const config = loadLocalConfig();
-  config.defaultThopter = name;
-  saveLocalConfig(config);
+  updateLocalConfig((config) => {
+    config.defaultThopter = name;
+  });
 }
 
 export function clearDefaultThopter(): void {
-  const config = loadLocalConfig();
-  delete config.defaultThopter;
-  saveLocalConfig(config);
+  updateLocalConfig((config) => {
+    delete config.defaultThopter;
+  });
 }
 
 /**
@@ -168,30 +320,32 @@ export function getRepos(): RepoConfig[] {
 }
 
 export function setRepos(repos: RepoConfig[]): void {
-  const config = loadLocalConfig();
-  config.repos = repos;
-  saveLocalConfig(config);
+  updateLocalConfig((config) => {
+    config.repos = repos;
+  });
 }
 
 export function addRepo(entry: RepoConfig): void {
-  const config = loadLocalConfig();
-  if (!config.repos) config.repos = [];
-  config.repos.push(entry);
-  saveLocalConfig(config);
+  updateLocalConfig((config) => {
+    if (!config.repos) config.repos = [];
+    config.repos.push(entry);
+  });
 }
 
 export function removeRepo(repo: string, branch?: string): boolean {
-  const config = loadLocalConfig();
-  if (!config.repos) return false;
-  const before = config.repos.length;
-  config.repos = config.repos.filter((r) => {
-    if (r.repo !== repo) return true;
-    if (branch !== undefined) return r.branch !== branch;
-    return false;
+  let removed = false;
+  updateLocalConfig((config) => {
+    if (!config.repos) return false;
+    const before = config.repos.length;
+    config.repos = config.repos.filter((r) => {
+      if (r.repo !== repo) return true;
+      if (branch !== undefined) return r.branch !== branch;
+      return false;
+    });
+    removed = config.repos.length !== before;
+    return removed;
   });
-  if (config.repos.length === before) return false;
-  saveLocalConfig(config);
-  return true;
+  return removed;
 }
 
 // --- Devbox env vars ---
@@ -217,18 +371,17 @@ export function getEnvVars(): Record<string, string> {
 
 export function setEnvVar(key: string, value: string): void {
   validateEnvKey(key);
-  const config = loadLocalConfig();
-  if (!config.envVars) config.envVars = {};
-  config.envVars[key] = value;
-  saveLocalConfig(config);
+  updateLocalConfig((config) => {
+    if (!config.envVars) config.envVars = {};
+    config.envVars[key] = value;
+  });
 }
 
 export function deleteEnvVar(key: string): void {
-  const config = loadLocalConfig();
-  if (config.envVars) {
+  updateLocalConfig((config) => {
+    if (!config.envVars) return false;
     delete config.envVars[key];
-    saveLocalConfig(config);
-  }
+  });
 }
 
 // --- Custom CLAUDE.md and file uploads ---
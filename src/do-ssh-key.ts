@@ -1,9 +1,18 @@
 import { execFileSync } from "node:child_process";
+import { createHash } from "node:crypto";
 import { readFileSync, existsSync } from "node:fs";
 import { resolve } from "node:path";
 
-function doctlJson(args: string[]): unknown {
-  const raw = execFileSync("doctl", [...args, "-o", "json"], { encoding: "utf-8" });
+function doctlJson(args: string[], opts?: { quiet?: boolean }): unknown {
+  // Same capture limit as devbox.ts; Node's 1 MiB default is easy to hit
+  // with large doctl listings.
+  const raw = execFileSync("doctl", [...args, "-o", "json"], {
+    encoding: "utf-8",
+    maxBuffer: 64 * 1024 * 1024,
+    // quiet: capture stderr instead of passing it through, for probes where
+    // a failure is an expected answer rather than an error to show.
+    ...(opts?.quiet ? { stdio: "pipe" as const } : {}),
+  });
   return JSON.parse(raw);
 }
 
@@ -31,6 +40,36 @@ function normalizePublicKey(value: string): string {
   return `${parts[0]} ${parts[1]}`;
 }
 
+/**
+ * MD5 fingerprint of an OpenSSH public key, in the colon-separated form
+ * DigitalOcean uses as the SSH key ID.
+ */
+function md5Fingerprint(normalizedPublicKey: string): string | null {
+  const blob = normalizedPublicKey.split(" ")[1];
+  if (!blob) return null;
+  const digest = createHash("md5").update(Buffer.from(blob, "base64")).digest("hex");
+  return digest.match(/../g)!.join(":");
+}
+
+/**
+ * Point lookup of a single key by fingerprint. Cheaper than listing every key
+ * on the account; returns null if the key isn't registered (doctl exits
+ * non-zero on a 404).
+ */
+function getFingerprintIfRegistered(fingerprint: string, localNormalizedPublicKey: string): string | null {
+  let raw: unknown;
+  try {
+    raw = doctlJson(["compute", "ssh-key", "get", fingerprint], { quiet: true });
+  } catch {
+    return null;
+  }
+  const entry = (Array.isArray(raw) ? raw[0] : raw) as Record<string, unknown> | undefined;
+  if (!entry) return null;
+  const publicKey = normalizePublicKey(String(entry.public_key ?? entry.PublicKey ?? ""));
+  if (publicKey !== localNormalizedPublicKey) return null;
+  return String(entry.fingerprint ?? entry.Fingerprint ?? fingerprint);
+}
+
 function findMatchingFingerprint(localNormalizedPublicKey: string): string | null {
   const raw = doctlJson(["compute", "ssh-key", "list"]);
   if (!Array.isArray(raw)) {
@@ -46,13 +85,28 @@ function findMatchingFingerprint(localNormalizedPublicKey: string): string | nul
   return null;
 }
 
+// The key registration can't change under us within one CLI run, so the
+// lookup (a doctl list call) only needs to happen once per process.
+let cachedFingerprint: string | undefined;
+
 /**
  * Ensure ~/.ssh/id_rsa.pub exists in DigitalOcean SSH keys.
  * Returns the matching fingerprint (existing or newly imported).
  */
 export function ensureDOFingerprintForLocalRSAPub(): string {
+  if (cachedFingerprint) return cachedFingerprint;
+  cachedFingerprint = lookupOrImportFingerprint();
+  return cachedFingerprint;
+}
+
+function lookupOrImportFingerprint(): string {
   const pubPath = getLocalRSAPublicKeyPath();
   const localPub = normalizePublicKey(readFileSync(pubPath, "utf-8"));
+  const localFingerprint = md5Fingerprint(localPub);
+  if (localFingerprint) {
+    const registered = getFingerprintIfRegistered(localFingerprint, localPub);
+    if (registered) return registered;
+  }
   const existing = findMatchingFingerprint(localPub);
   if (existing) return existing;
 
@@ -0,0 +1,241 @@
+/**
+ * Cloud-init / launch scripts that run inside a thopter on first boot.
+ *
+ * Kept out of devbox.ts so commands that never create a thopter (status,
+ * ssh, exec, ...) don't have to load these large template strings.
+ */
+
+/** Tool installation script that runs inside the devbox on first create. */
+export const INIT_SCRIPT = `
+set -euo pipefail
+
+THOPTER_INIT_LOG="$HOME/thopter-init.log"
+THOPTER_INIT_WARN="$HOME/.thopter-init-warnings"
+mkdir -p "$(dirname "$THOPTER_INIT_LOG")"
+: > "$THOPTER_INIT_WARN"
+exec > >(tee -a "$THOPTER_INIT_LOG") 2>&1
+
+# Encode one command as RESP, so a progress update's commands can share a
+# single redis-cli --pipe (one connection and TLS handshake) instead of
+# spawning redis-cli per command.
+resp_cmd() {
+  local LC_ALL=C arg
+  printf '*%d\\r\\n' "$#"
+  for arg in "$@"; do
+    printf '$%d\\r\\n%s\\r\\n' "\${#arg}" "$arg"
+  done
+}
+
+progress() {
+  local stage="$1"
+  local message="$2"
+  local now
+  now="$(date -u +%Y-%m-%dT%H:%M:%SZ)"
+  echo "[thopter-init][$stage] $message"
+  if [ -z "\${THOPTER_REDIS_URL:-}" ] || [ -z "\${THOPTER_NAME:-}" ]; then
+    return 0
+  fi
+  {
+    resp_cmd SETEX "thopter:$THOPTER_NAME:create:stage" 3600 "$stage"
+    resp_cmd SETEX "thopter:$THOPTER_NAME:create:message" 3600 "$message"
+    resp_cmd SETEX "thopter:$THOPTER_NAME:create:timestamp" 3600 "$now"
+    resp_cmd RPUSH "thopter:$THOPTER_NAME:create:logs" "$now [$stage] $message"
+    resp_cmd LTRIM "thopter:$THOPTER_NAME:create:logs" -200 -1
+    resp_cmd EXPIRE "thopter:$THOPTER_NAME:create:logs" 3600
+  } | redis-cli --tls -u "$THOPTER_REDIS_URL" --pipe >/dev/null 2>&1 || true
+}
+
+echo "[thopter-init] starting at $(date -Is)"
+progress "start" "thopter cloud-init started"
+
+run_optional() {
+  local label="$1"
+  shift
+  progress "optional:$label" "starting optional step"
+  if "$@"; then
+    echo "[thopter-init] OK(optional): $label"
+    progress "optional:$label" "optional step complete"
+    return 0
+  fi
+  echo "[thopter-init] WARN(optional): $label"
+  echo "$label" >> "$THOPTER_INIT_WARN"
+  progress "optional:$label" "optional step failed (continuing)"
+  return 0
+}
+
+# Install essential tools
+progress "apt" "installing base packages"
+curl -fsSL https://cli.github.com/packages/githubcli-archive-keyring.gpg | sudo dd of=/usr/share/keyrings/githubcli-archive-keyring.gpg 2>/dev/null && sudo chmod go+r /usr/share/keyrings/githubcli-archive-keyring.gpg && echo "deb [arch=$(dpkg --print-architecture) signed-by=/usr/share/keyrings/githubcli-archive-keyring.gpg] https://cli.github.com/packages stable main" | sudo tee /etc/apt/sources.list.d/github-cli.list > /dev/null
+sudo apt-get update -qq && sudo apt-get install -y -qq git tmux wget curl jq redis-tools cron ripgrep fd-find htop tree unzip bat less strace lsof ncdu dnsutils net-tools iproute2 xvfb xauth bash-completion gh > /dev/null
+sudo /usr/sbin/cron 2>/dev/null || true
+
+# Install Neovim (latest stable, NvChad requires 0.10+)
+progress "nvim" "installing neovim"
+NVIM_ARCH=$(uname -m | sed 's/aarch64/arm64/;s/x86_64/x86_64/')
+curl -fsSL "https://github.com/neovim/neovim/releases/latest/download/nvim-linux-\${NVIM_ARCH}.tar.gz" | sudo tar xz -C /opt
+sudo ln -sf /opt/nvim-linux-\${NVIM_ARCH}/bin/nvim /usr/local/bin/nvim
+
+# Install Node.js via NVM (Node 22) and make it default
+progress "node" "installing node via nvm"
+export NVM_DIR="$HOME/.nvm"
+curl -fsSL https://raw.githubusercontent.com/nvm-sh/nvm/v0.40.3/install.sh | bash
+. "$NVM_DIR/nvm.sh"
+nvm install 22
+nvm alias default 22
+nvm use 22
+NODE_BIN_DIR="$NVM_DIR/versions/node/$(nvm version 22)/bin"
+sudo ln -sf "$NODE_BIN_DIR/node" /usr/local/bin/node
+sudo ln -sf "$NODE_BIN_DIR/npm" /usr/local/bin/npm
+sudo ln -sf "$NODE_BIN_DIR/npx" /usr/local/bin/npx
+
+# Ensure canonical working directory exists for automated runs.
+mkdir -p "$HOME/workspace"
+
+# Install NvChad starter (fresh installs only)
+if [ ! -d ~/.config/nvim ]; then
+  run_optional "clone NvChad starter" git clone https://github.com/NvChad/starter ~/.config/nvim
+fi
+
+# Install Claude Code with retries and health check
+progress "claude" "installing claude code"
+export PATH="$HOME/.local/bin:$PATH"
+install_claude() {
+  local attempts=3
+  local i=1
+  while [ "$i" -le "$attempts" ]; do
+    # Clear previous installer artifacts/payloads so retries always start clean.
+    rm -f "$HOME/.claude/downloads/claude-"* 2>/dev/null || true
+    rm -f "$HOME/.local/bin/claude" 2>/dev/null || true
+    rm -rf "$HOME/.local/share/claude" 2>/dev/null || true
+    hash -r || true
+    if curl -fsSL https://claude.ai/install.sh | bash; then
+      if command -v claude >/dev/null 2>&1; then
+        CLAUDE_BIN="$(command -v claude)"
+        if [ -x "$CLAUDE_BIN" ] && "$CLAUDE_BIN" --version >/dev/null 2>&1; then
+          return 0
+        fi
+      fi
+      if [ -x "$HOME/.local/bin/claude" ] && "$HOME/.local/bin/claude" --version >/dev/null 2>&1; then
+        return 0
+      fi
+    fi
+    echo "Claude install/verify failed (attempt $i/$attempts), retrying..."
+    sleep 5
+    i=$((i + 1))
+  done
+  echo "ERROR: Claude installation failed after $attempts attempts."
+  return 1
+}
+install_claude
+
+# Install OpenAI Codex
+progress "codex" "installing openai codex"
+run_optional "install @openai/codex" npm i -g @openai/codex
+
+# Install Runloop CLI (for rli devbox ssh from inside devboxes)
+progress "rl-cli" "installing runloop cli"
+run_optional "install @runloop/rl-cli" npm i -g @runloop/rl-cli
+
+# Install git-delta pager
+progress "git-delta" "installing git-delta"
+DELTA_ARCH=$(dpkg --print-architecture)
+run_optional "install git-delta" bash -lc "curl -fL https://github.com/dandavison/delta/releases/download/0.18.2/git-delta_0.18.2_\${DELTA_ARCH}.deb -o /tmp/git-delta.deb && sudo PATH=/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin dpkg -i /tmp/git-delta.deb && rm /tmp/git-delta.deb && git config --global core.pager delta && git config --global interactive.diffFilter 'delta --color-only' && git config --global delta.side-by-side true && git config --global delta.navigate true && git config --global delta.line-numbers true"
+
+# Install starship prompt (non-interactive)
+progress "starship" "installing starship"
+run_optional "install starship" bash -lc "curl -sS https://starship.rs/install.sh | sh -s -- -y -b $HOME/.local/bin"
+
+# Append thopter bashrc block (idempotent — skip if already present)
+if ! grep -q '# --- thopter ---' ~/.bashrc 2>/dev/null; then
+cat >> ~/.bashrc << 'THOPTERRC'
+
+# --- thopter ---
+export PATH="$HOME/.local/bin:$PATH"
+alias yolo-claude="claude --dangerously-skip-permissions"
+alias attach-or-launch-tmux-cc="tmux -CC attach || tmux -CC"
+. ~/.thopter-env
+[ -f /usr/share/bash-completion/bash_completion ] && . /usr/share/bash-completion/bash_completion
+if [ "$TERM" != "dumb" ]; then
+  eval "$(starship init bash)"
+fi
+# --- end thopter ---
+THOPTERRC
+fi
+
+echo "[thopter-init] complete at $(date -Is)"
+progress "done" "thopter cloud-init completed"
+if [ -s "$THOPTER_INIT_WARN" ]; then
+  echo "[thopter-init] completed with optional warnings:"
+  cat "$THOPTER_INIT_WARN"
+fi
+touch "$HOME/.thopter-init-complete"
+`.trim();
+
+/** Fast reconcile script for snapshot-based boots (no full reinstall). */
+export const SNAPSHOT_INIT_SCRIPT = `
+set -euo pipefail
+
+THOPTER_INIT_LOG="$HOME/thopter-init.log"
+THOPTER_INIT_WARN="$HOME/.thopter-init-warnings"
+mkdir -p "$(dirname "$THOPTER_INIT_LOG")"
+: > "$THOPTER_INIT_WARN"
+exec > >(tee -a "$THOPTER_INIT_LOG") 2>&1
+
+# Encode one command as RESP, so a progress update's commands can share a
+# single redis-cli --pipe (one connection and TLS handshake) instead of
+# spawning redis-cli per command.
+resp_cmd() {
+  local LC_ALL=C arg
+  printf '*%d\\r\\n' "$#"
+  for arg in "$@"; do
+    printf '$%d\\r\\n%s\\r\\n' "\${#arg}" "$arg"
+  done
+}
+
+progress() {
+  local stage="$1"
+  local message="$2"
+  local now
+  now="$(date -u +%Y-%m-%dT%H:%M:%SZ)"
+  echo "[thopter-init][$stage] $message"
+  if [ -z "\${THOPTER_REDIS_URL:-}" ] || [ -z "\${THOPTER_NAME:-}" ]; then
+    return 0
+  fi
+  {
+    resp_cmd SETEX "thopter:$THOPTER_NAME:create:stage" 3600 "$stage"
+    resp_cmd SETEX "thopter:$THOPTER_NAME:create:message" 3600 "$message"
+    resp_cmd SETEX "thopter:$THOPTER_NAME:create:timestamp" 3600 "$now"
+    resp_cmd RPUSH "thopter:$THOPTER_NAME:create:logs" "$now [$stage] $message"
+    resp_cmd LTRIM "thopter:$THOPTER_NAME:create:logs" -200 -1
+    resp_cmd EXPIRE "thopter:$THOPTER_NAME:create:logs" 3600
+  } | redis-cli --tls -u "$THOPTER_REDIS_URL" --pipe >/dev/null 2>&1 || true
+}
+
+echo "[thopter-init] snapshot reconcile starting at $(date -Is)"
+progress "start" "thopter cloud-init started (snapshot mode)"
+
+progress "snapshot-reconcile" "ensuring baseline runtime state"
+mkdir -p "$HOME/workspace"
+sudo /usr/sbin/cron 2>/dev/null || true
+export PATH="$HOME/.local/bin:/usr/local/bin:/usr/bin:/bin:$PATH"
+hash -r || true
+
+if ! command -v node >/dev/null 2>&1 || ! node -v >/dev/null 2>&1; then
+  echo "ERROR: node is missing or unhealthy in snapshot image."
+  exit 1
+fi
+
+if ! command -v npm >/dev/null 2>&1 || ! npm -v >/dev/null 2>&1; then
+  echo "ERROR: npm is missing or unhealthy in snapshot image."
+  exit 1
+fi
+
+if ! command -v claude >/dev/null 2>&1 || ! claude --version >/dev/null 2>&1; then
+  echo "ERROR: claude is missing or unhealthy in snapshot image."
+  exit 1
+fi
+
+echo "[thopter-init] snapshot reconcile complete at $(date -Is)"
+progress "done" "thopter cloud-init completed (snapshot mode)"
+touch "$HOME/.thopter-init-complete"
+`.trim();
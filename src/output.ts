@@ -16,18 +16,19 @@ export function printTable(
     Math.max(h.length, ...rows.map((r) => (r[i] ?? "").length)),
   );
 
-  // Header
+  // Build the whole table and write it once rather than a console.log per row
+  const lines: string[] = [];
   const headerLine = headers
     .map((h, i) => h.padEnd(widths[i]))
     .join("  ");
-  console.log(`  ${headerLine}`);
-  console.log(`  ${widths.map((w) => "─".repeat(w)).join("  ")}`);
+  lines.push(`  ${headerLine}`);
+  lines.push(`  ${widths.map((w) => "─".repeat(w)).join("  ")}`);
 
-  // Rows
   for (const row of rows) {
     const line = row.map((cell, i) => (cell ?? "").padEnd(widths[i])).join("  ");
-    console.log(`  ${line}`);
+    lines.push(`  ${line}`);
   }
+  process.stdout.write(lines.join("\n") + "\n");
 }
 
 export interface TableOptions {
@@ -104,7 +104,7 @@ export async function runReauth(): Promise<void> {
 
   if (choice === "a") {
     // List managed devboxes and let user pick
-    const client = getClient();
+    const client = await getClient();
     const devboxes: { name: string; id: string; status: string }[] = [];
     for (const status of ["running", "suspended", "provisioning", "initializing"] as const) {
       for await (const db of client.devboxes.list({ status, limit: 100 })) {
@@ -219,7 +219,7 @@ export async function runReauth(): Promise<void> {
   console.log();
 
   // Check if a snapshot with this name already exists
-  const client = getClient();
+  const client = await getClient();
   let existingSnapshotId: string | undefined;
   for await (const s of client.devboxes.diskSnapshots.list({ limit: 100 })) {
     if (s.name === snapshotName) {
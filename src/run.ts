@@ -134,55 +134,101 @@ function resolveMode(opts: {
 
 // --- Clone helper ---
 
-async function cloneRepos(
-  devboxId: string,
-  checkouts: RepoCheckout[],
-  thopterName: string,
-): Promise<void> {
-  for (const checkout of checkouts) {
-    const repo = validateRepo(checkout.repo);
-    validateBranch(checkout.branch);
-    const repoName = repo.split("/")[1];
+interface CloneResult {
+  repo: string;
+  output: string;
+  errors: string;
+  exitCode: number;
+}
 
-    const cloneScript = [
+async function cloneRepo(devboxId: string, checkout: RepoCheckout): Promise<CloneResult> {
+  const repo = validateRepo(checkout.repo);
+  validateBranch(checkout.branch);
+  const repoName = repo.split("/")[1];
+
+  const cloneScript = [
+    `mkdir -p "${WORKSPACE_DIR}"`,
+    `cd "${WORKSPACE_DIR}"`,
+    `if [ ! -d "${repoName}" ]; then git clone "https://github.com/${repo}.git"; fi`,
+    `cd "${repoName}"`,
+    `git fetch origin`,
+    `git checkout "${checkout.branch}"`,
+    `git reset --hard "origin/${checkout.branch}"`,
+  ].join(" && ");
+
+  let output = "";
+  let errors = "";
+  let cloneResult = await executeCommandById(devboxId, cloneScript);
+  output += cloneResult.stdout;
+  errors += cloneResult.stderr;
+
+  if (cloneResult.exitCode !== 0) {
+    // Snapshot-based boots can inherit damaged git state (e.g. corrupted .git/index).
+    // One-shot self-heal: remove existing checkout and re-clone cleanly.
+    output += `Repository setup failed for ${repo}; attempting clean re-clone...\n`;
+    const recloneScript = [
       `mkdir -p "${WORKSPACE_DIR}"`,
       `cd "${WORKSPACE_DIR}"`,
-      `if [ ! -d "${repoName}" ]; then git clone "https://github.com/${repo}.git"; fi`,
+      `rm -rf "${repoName}"`,
+      `git clone "https://github.com/${repo}.git" "${repoName}"`,
       `cd "${repoName}"`,
       `git fetch origin`,
       `git checkout "${checkout.branch}"`,
       `git reset --hard "origin/${checkout.branch}"`,
     ].join(" && ");
+    cloneResult = await executeCommandById(devboxId, recloneScript);
+    output += cloneResult.stdout;
+    errors += cloneResult.stderr;
+  }
 
-    console.log(`Cloning ${repo}...`);
-    let cloneResult = await executeCommandById(devboxId, cloneScript);
-    if (cloneResult.stdout) process.stdout.write(cloneResult.stdout);
-    if (cloneResult.stderr) process.stderr.write(cloneResult.stderr);
-
-    if (cloneResult.exitCode !== 0) {
-      // Snapshot-based boots can inherit damaged git state (e.g. corrupted .git/index).
-      // One-shot self-heal: remove existing checkout and re-clone cleanly.
-      console.log(`Repository setup failed for ${repo}; attempting clean re-clone...`);
-      const recloneScript = [
-        `mkdir -p "${WORKSPACE_DIR}"`,
-        `cd "${WORKSPACE_DIR}"`,
-        `rm -rf "${repoName}"`,
-        `git clone "https://github.com/${repo}.git" "${repoName}"`,
-        `cd "${repoName}"`,
-        `git fetch origin`,
-        `git checkout "${checkout.branch}"`,
-        `git reset --hard "origin/${checkout.branch}"`,
-      ].join(" && ");
-      cloneResult = await executeCommandById(devboxId, recloneScript);
-      if (cloneResult.stdout) process.stdout.write(cloneResult.stdout);
-      if (cloneResult.stderr) process.stderr.write(cloneResult.stderr);
-    }
+  return { repo, output, errors, exitCode: cloneResult.exitCode };
+}
 
-    if (cloneResult.exitCode !== 0) {
-      console.error(`\nError: Repository setup failed for ${repo} (exit ${cloneResult.exitCode}).`);
-      console.error(`  The devbox '${thopterName}' is still running. Debug with: thopter ssh ${thopterName}`);
-      process.exit(1);
-    }
+/**
+ * Clone all checkouts concurrently. Checkouts that land in the same directory
+ * (same repo, different branches) still run in order, as before.
+ */
+async function cloneRepos(
+  devboxId: string,
+  checkouts: RepoCheckout[],
+  thopterName: string,
+): Promise<void> {
+  const byDir = new Map<string, RepoCheckout[]>();
+  for (const checkout of checkouts) {
+    const repoName = validateRepo(checkout.repo).split("/")[1];
+    validateBranch(checkout.branch);
+    const group = byDir.get(repoName) ?? [];
+    group.push(checkout);
+    byDir.set(repoName, group);
+  }
+
+  for (const checkout of checkouts) {
+    console.log(`Cloning ${checkout.repo}...`);
+  }
+
+  const results = (
+    await Promise.all(
+      [...byDir.values()].map(async (group) => {
+        const groupResults: CloneResult[] = [];
+        for (const checkout of group) {
+          groupResults.push(await cloneRepo(devboxId, checkout));
+        }
+        return groupResults;
+      }),
+    )
+  ).flat();
+
+  // Print each repo's output as one block so parallel clones don't interleave
+  for (const result of results) {
+    if (result.output) process.stdout.write(result.output);
+    if (result.errors) process.stderr.write(result.errors);
+  }
+
+  const failed = results.find((r) => r.exitCode !== 0);
+  if (failed) {
+    console.error(`\nError: Repository setup failed for ${failed.repo} (exit ${failed.exitCode}).`);
+    console.error(`  The devbox '${thopterName}' is still running. Debug with: thopter ssh ${thopterName}`);
+    process.exit(1);
   }
 }
 
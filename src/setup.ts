@@ -133,7 +133,7 @@ export async function runSetup(): Promise<void> {
     // Verify auth
     console.log("  Verifying...");
     try {
-      const client = getClient();
+      const client = await getClient();
       await client.devboxes.list({ limit: 1 });
       console.log("  Authenticated to Runloop.");
     } catch (e: unknown) {
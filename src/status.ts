@@ -52,15 +52,23 @@ export async function getRedisInfoForNames(names: string[]): Promise<Map<string,
 
   const redis = getRedis();
   try {
-    const results = new Map<string, ThopterInfo>();
+    // One pipelined round trip for all thopters instead of an MGET each
+    const pipeline = redis.pipeline();
     for (const name of names) {
       const prefix = `thopter:${name}`;
-      const values = await redis.mget(...REDIS_FIELDS.map((f) => `${prefix}:${f}`));
-      const info = parseRedisValues(name, values);
+      pipeline.mget(...REDIS_FIELDS.map((f) => `${prefix}:${f}`));
+    }
+    const replies = (await pipeline.exec()) ?? [];
+
+    const results = new Map<string, ThopterInfo>();
+    names.forEach((name, i) => {
+      const [err, values] = replies[i] ?? [];
+      if (err || !Array.isArray(values)) return;
+      const info = parseRedisValues(name, values as (string | null)[]);
       if (info.heartbeat || info.status || info.id) {
         results.set(name, info);
       }
-    }
+    });
     return results;
   } finally {
     redis.disconnect();
@@ -84,9 +92,8 @@ export async function showThopterStatus(name: string): Promise<void> {
   let devboxId = "-";
   if (isDigitalOceanProvider()) {
     try {
-      const { fetchThopters } = await import("./devbox.js");
-      const thopters = await fetchThopters();
-      const found = thopters.find((t) => t.name === name);
+      const { findDOThopter } = await import("./devbox.js");
+      const found = findDOThopter(name);
       if (found) {
         devboxStatus = found.devboxStatus;
         devboxId = found.id;
@@ -98,7 +105,7 @@ export async function showThopterStatus(name: string): Promise<void> {
     try {
       const { getClient } = await import("./client.js");
       const { MANAGED_BY_KEY, MANAGED_BY_VALUE, NAME_KEY } = await import("./config.js");
-      const client = getClient();
+      const client = await getClient();
       outer:
       for (const s of ["running", "suspended", "provisioning", "initializing", "suspending", "resuming"] as const) {
         for await (const db of client.devboxes.list({ status: s, limit: 100 })) {
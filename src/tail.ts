@@ -4,8 +4,7 @@
  */
 
 import { Redis } from "ioredis";
-import { Marked } from "marked";
-import { markedTerminal } from "marked-terminal";
+import type { Marked } from "marked";
 
 function getRedis(): Redis {
   const url = process.env.THOPTER_REDIS_URL;
@@ -41,10 +40,21 @@ const c = {
   magenta: (s: string) => (useColor ? `\x1b[35m${s}\x1b[0m` : s),
 };
 
-// Markdown renderer for full mode
-const marked = new Marked(markedTerminal());
+// Markdown renderer for full mode. Loaded on demand so `tail --short` (and
+// anything else that imports this module) doesn't pay for marked/marked-terminal.
+let marked: Marked | undefined;
+
+async function loadMarkdownRenderer(): Promise<void> {
+  if (marked) return;
+  const [{ Marked }, { markedTerminal }] = await Promise.all([
+    import("marked"),
+    import("marked-terminal"),
+  ]);
+  marked = new Marked(markedTerminal());
+}
 
 function renderMarkdown(text: string): string {
+  if (!marked) return text;
   const rendered = marked.parse(text);
   if (typeof rendered !== "string") return text;
   // marked-terminal adds a trailing newline; trim it
@@ -121,12 +131,16 @@ function parseEntry(raw: string): TranscriptEntry | null {
 }
 
 function printEntries(entries: string[], short: boolean): void {
+  const lines: string[] = [];
   for (const raw of entries) {
     const entry = parseEntry(raw);
     if (entry) {
-      console.log(formatEntry(entry, short));
+      lines.push(formatEntry(entry, short));
     }
   }
+  if (lines.length > 0) {
+    process.stdout.write(lines.join("\n") + "\n");
+  }
 }
 
 export async function tailTranscript(
@@ -136,8 +150,10 @@ export async function tailTranscript(
   const redis = getRedis();
   const key = `thopter:${name}:transcript`;
   const seqKey = `thopter:${name}:transcript_seq`;
+  const eventsChannel = `thopter:${name}:transcript_events`;
   const numLines = opts.lines ?? 20;
   const short = opts.short ?? false;
+  if (!short) await loadMarkdownRenderer();
 
   try {
     // Get initial entries
@@ -168,8 +184,7 @@ export async function tailTranscript(
     let lastSeq = parseInt(await redis.get(seqKey) ?? "0", 10);
     let lastLen = await redis.llen(key);
 
-    // Poll every second
-    const interval = setInterval(async () => {
+    const checkOnce = async () => {
       try {
         const currentSeq = parseInt(await redis.get(seqKey) ?? "0", 10);
 
@@ -201,11 +216,47 @@ export async function tailTranscript(
       } catch {
         // Ignore transient Redis errors during polling
       }
+    };
+
+    // Serialize checks: a pub/sub wake-up and a poll tick can fire together,
+    // and overlapping runs would print the same entries twice.
+    let checking = false;
+    let recheck = false;
+    const check = async () => {
+      if (checking) {
+        recheck = true;
+        return;
+      }
+      checking = true;
+      try {
+        do {
+          recheck = false;
+          await checkOnce();
+        } while (recheck);
+      } finally {
+        checking = false;
+      }
+    };
+
+    // Wake immediately when the devbox-side pusher publishes new entries.
+    const subscriber = redis.duplicate();
+    subscriber.on("error", () => {
+      // Best-effort; the poll below still picks up new entries.
+    });
+    subscriber.on("message", () => {
+      void check();
+    });
+    subscriber.subscribe(eventsChannel).catch(() => {});
+
+    // Poll every second as a fallback (older devboxes don't publish)
+    const interval = setInterval(() => {
+      void check();
     }, 1000);
 
     // Clean up on Ctrl-C
     const cleanup = () => {
       clearInterval(interval);
+      subscriber.disconnect();
       redis.disconnect();
       process.exit(0);
     };
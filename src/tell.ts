@@ -3,7 +3,6 @@
  */
 
 import { resolveDevbox, executeCommandById, writeFileById } from "./devbox.js";
-import { tailTranscript } from "./tail.js";
 
 /**
  * Check whether tmux is running on the devbox.
@@ -132,7 +131,10 @@ export async function tellThopter(
 
   if (!opts.noTail) {
     console.log("Tailing transcript...\n");
-    // Enter tail -f mode so the user sees Claude's response
+    // Enter tail -f mode so the user sees Claude's response. tail.js pulls in
+    // ioredis, so only load it when we actually tail (not for --no-tail or
+    // `thopter check`).
+    const { tailTranscript } = await import("./tail.js");
     await tailTranscript(name, { follow: true, lines: 5 });
   }
 }